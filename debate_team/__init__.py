@@ -1,15 +1,7 @@
 # =============================================================================
 # DEBATE_TEAM PACKAGE - INITIALIZATION MODULE
 # =============================================================================
-# This is the __init__.py file for the debate_team package. In Python, any
-# directory containing an __init__.py file is treated as a "package" - a
-# collection of related modules that can be imported together.
-#
-# Key concepts demonstrated:
-# - Python package structure and organization
-# - Module importing and namespace management
-# - Making local modules available for import
-# - Package initialization patterns
+# Tutorial notes on packages and lazy loading live in TUTORIAL.md.
 # =============================================================================
 
 """
@@ -25,126 +17,119 @@ Agent Development Kit (ADK). It provides sophisticated AI agents that can:
 
 Main Components:
     agent.py: Contains all the ADK agent definitions and workflow logic
+    TUTORIAL.md: Beginner notes on the package layout and ADK patterns
 
 Usage:
     from debate_team.agent import root_agent
     # Now you can use root_agent in your deployment scripts
+
+Environment:
+    DEBATE_TEAM_EAGER_IMPORT: When set to any non-empty value, the agent
+        graph (root_agent) is built as soon as the package is imported. Use
+        this in CI and production containers so a broken ADK install fails
+        at startup instead of on the first request.
 """
 
 # --- MODULE IMPORTS ---
-# Import the agent module to make it available when someone imports this package
-# The dot (.) means "import from the current package directory"
-from . import agent
-
-# This import statement does several important things:
-#
-# 1. **Makes the module available**: When someone writes "from debate_team import agent",
-#    Python knows where to find the agent module
-#
-# 2. **Enables sub-imports**: Allows "from debate_team.agent import root_agent" 
-#    to work properly in other files like deploy.py
-#
-# 3. **Package namespace**: Creates a clean namespace where agent.py becomes
-#    accessible as "debate_team.agent" from outside the package
-#
-# 4. **Lazy loading**: The agent module isn't actually loaded until someone
-#    tries to use it, which improves startup performance
+# import_module is bound once here so every lazy resolver below calls it
+# directly instead of looking up importlib.import_module each time
+from importlib import import_module as _import_module
+# sys: sys.modules is checked before falling back to the import machinery
+import sys
+# os: used to read the DEBATE_TEAM_EAGER_IMPORT switch below
+import os
 
-# =============================================================================
-# PYTHON PACKAGE CONCEPTS FOR BEGINNERS
-# =============================================================================
-#
-# What is a Package?
-# ------------------
-# A package is a way to organize related Python modules (files) together.
-# Think of it like a folder that contains related Python files, but with
-# special powers that let you import from it.
-#
-# Package Structure:
-# ------------------
-# debate_team/                 <- This is the package directory
-#   ├── __init__.py           <- This file (makes it a package)
-#   ├── agent.py              <- Module containing our ADK agents
-#   └── (other modules...)     <- Could add more modules here
-#
-# Without __init__.py:
-# --------------------
-# If this file didn't exist, "debate_team" would just be a regular folder
-# and you couldn't write "from debate_team.agent import root_agent"
-#
-# Import Patterns Enabled:
-# ------------------------
-# Because of this __init__.py file, these imports work:
-#   
-#   1. import debate_team                    # Imports the whole package
-#   2. import debate_team.agent              # Imports the agent module
-#   3. from debate_team import agent         # Imports agent into local namespace
-#   4. from debate_team.agent import root_agent  # Imports specific object
-#
-# Real-World Analogy:
-# -------------------
-# Think of a package like a library building:
-# - The building is the package directory (debate_team/)
-# - __init__.py is like the front desk that helps people find things
-# - Each module (agent.py) is like a section of books on a specific topic
-# - Imports are like asking the front desk "Where can I find the debate agents?"
-#
-# =============================================================================
+# Names this package exports (used by "from debate_team import *" and dir())
+__all__ = ["agent", "root_agent", "__version__"]
 
-# --- FUTURE PACKAGE EXPANSION ---
-# As your project grows, you might add more modules to this package:
-#
-# debate_team/
-#   ├── __init__.py          <- This file
-#   ├── agent.py             <- Main agent definitions  
-#   ├── tools.py             <- Custom tools for agents
-#   ├── config.py            <- Configuration management
-#   ├── utils.py             <- Helper functions
-#   └── tests/               <- Test modules
-#       ├── __init__.py
-#       ├── test_agents.py
-#       └── test_tools.py
-#
-# Then you could update this file to import everything:
-#   from . import agent
-#   from . import tools  
-#   from . import config
-#   from . import utils
-#
-# This would allow users to access everything with:
-#   from debate_team import agent, tools, config, utils
-
-# --- PACKAGE METADATA (OPTIONAL) ---
-# You can also define package-level information here:
-
-__version__ = "1.0.0"
-__author__ = "Nicky Clarke"
-__description__ = "Multi-agent debate system using Google ADK"
-
-# These variables become available when someone imports the package:
-#   import debate_team
-#   print(debate_team.__version__)  # Prints: 1.0.0
 
-# =============================================================================
-# WHY THIS MATTERS FOR ADK DEVELOPMENT
-# =============================================================================
-#
-# Clean Deployment:
-# -----------------
-# In deploy.py, we can cleanly import with:
-#   from debate_team.agent import root_agent
-# 
-# This works because:
-# 1. This __init__.py makes "debate_team" a valid package
-# 2. The "from . import agent" makes agent.py accessible
-# 3. Python can then find root_agent inside the agent module
-#
-# Professional Organization:
-# --------------------------
-# Having proper package structure makes your ADK project:
-# - Easier to understand for other developers
-# - Ready for distribution (could upload to PyPI)
-# - Scalable as you add more agents and tools
-# - Compatible with modern Python tooling (poetry, pip, etc.)
-#
-# =============================================================================
\ No newline at end of file
+# --- CACHED IMPORT HELPER ---
+# import_module walks the full import machinery on every call, even
+# for modules that are already loaded. This helper reads sys.modules first and
+# only falls through to import_module on a miss, or while the module is still
+# being initialized (so callers never see a half-built module).
+# Deploy scripts can use it too:
+#   _cached_import("debate_team.agent", "root_agent")
+def _cached_import(module_path, item_name):
+    mod = sys.modules.get(module_path)
+    spec = getattr(mod, "__spec__", None)
+    if mod is None or getattr(spec, "_initializing", False):
+        mod = _import_module(module_path)
+    return getattr(mod, item_name)
+
+
+# --- OPTIONAL IMPORT HELPER ---
+# For integrations that are only installed in some environments. A failed
+# import walks every finder on sys.meta_path, so failures are remembered in
+# _MISSING and later calls for the same path return None straight away.
+_MISSING = set()
+
+
+def _optional_import(module_path):
+    if module_path in _MISSING:
+        return None
+    try:
+        return _import_module(module_path)
+    except ImportError:
+        _MISSING.add(module_path)
+        return None
+
+
+# --- PACKAGE METADATA ---
+# Resolved on first access by __getattr__ rather than assigned at import time.
+# __version__ comes from the installed distribution metadata (pyproject.toml is
+# the source of truth) and falls back to this value when running from a plain
+# source checkout that was never pip-installed (such as the extra_packages
+# upload in deploy.py). Keep it equal to the version in pyproject.toml.
+_FALLBACK_VERSION = "0.1.0"
+_METADATA = {
+    "__author__": "Nicky Clarke",
+    "__description__": "Multi-agent debate system using Google ADK",
+}
+
+
+def _read_version():
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("debate_team")
+    except PackageNotFoundError:
+        return _FALLBACK_VERSION
+
+
+# --- LAZY SUBMODULE LOADING (PEP 562) ---
+# Importing agent.py pulls in google.adk and builds every agent and tool, which
+# is expensive. Instead of doing that on "import debate_team", Python calls this
+# module-level __getattr__ the first time someone reads "debate_team.agent".
+# The same hook serves the package metadata above.
+def __getattr__(name):
+    if name == "agent":
+        # The dot (.) means "import from the current package directory"
+        mod = _import_module(".agent", __name__)
+        # Cache the module so later accesses are a plain dictionary lookup
+        globals()["agent"] = mod
+        return mod
+    if name == "__version__":
+        value = globals()["__version__"] = _read_version()
+        return value
+    if name in _METADATA:
+        return _METADATA[name]
+    if name == "root_agent":
+        # Convenience re-export: "from debate_team import root_agent"
+        return _cached_import(f"{__name__}.agent", "root_agent")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    # Keep tab-completion and dir() aware of the lazily loaded names
+    return sorted(list(globals()) + __all__)
+
+
+# --- EAGER MODE SWITCH ---
+# Lazy loading means an ImportError (for example google-adk missing from a
+# deployment image) only shows up on first use. Health checks and CI can set
+# DEBATE_TEAM_EAGER_IMPORT=1 to build everything right away. Importing
+# agent.py alone is not enough: it loads no google.* module, so the switch
+# resolves root_agent, which imports ADK and constructs every agent.
+if os.environ.get("DEBATE_TEAM_EAGER_IMPORT"):
+    __getattr__("root_agent")
@@ -1,535 +1,366 @@
 # =============================================================================
 # AI DEBATE TEAM - Multi-Agent System using Google Agent Development Kit (ADK)
 # =============================================================================
-# This file demonstrates advanced ADK patterns including:
-# - Sequential Agents (step-by-step workflow)
-# - Parallel Agents (concurrent execution)
-# - Loop Agents (iterative back-and-forth interaction)
-# - Function Tools (custom capabilities for agents)
-# - Agent-to-Agent transfers and escalation
+# A walkthrough of the ADK patterns used here lives in TUTORIAL.md.
 # =============================================================================
 
 # --- IMPORTS ---
-# These imports bring in the core ADK classes and tools we need
-from google.adk.agents import Agent, LlmAgent, ParallelAgent, SequentialAgent, LoopAgent
-# Agent: Base class for all agents
-# LlmAgent: An agent powered by Large Language Models (like Gemini)
-# ParallelAgent: Runs multiple sub-agents simultaneously 
-# SequentialAgent: Runs sub-agents one after another in order
-# LoopAgent: Runs sub-agents in a loop for iterative interactions
-
-from google.adk.tools import google_search, FunctionTool
-# google_search: Built-in tool that lets agents search Google
-# FunctionTool: Wrapper to turn Python functions into agent tools
-
-from google.adk.tools import ToolContext
-# ToolContext: Special object passed to tool functions that provides
-# agent control capabilities like transfers and escalation
+import hashlib
+import logging
+import sys
+from functools import cache
+from typing import TYPE_CHECKING, Final
+
+# Nothing from google.adk or google.genai is imported at module scope, so
+# reading the config, instructions or tool functions from this module costs
+# no ADK import. The agent classes, FunctionTool and google_search are
+# imported inside the factories and tool getters, and load only when the
+# graph is built. ToolContext is needed only as the tools' type annotation,
+# which FunctionTool never resolves: it drops the tool_context parameter by
+# name. (importlib.util.LazyLoader would not help: finding any google.adk
+# submodule imports google/adk/__init__.py, which imports the agent classes
+# and runners.)
+if TYPE_CHECKING:
+    from google.adk.tools import ToolContext
+
+logger = logging.getLogger(__name__)
+
+# Public names; root_agent and start_workflow_tool are resolved lazily by
+# __getattr__ below
+__all__ = [
+    "root_agent",
+    "build_root_agent",
+    "GEMINI_MODEL",
+    "GEMINI_LITE_MODEL",
+    "SUMMARIZATION_MODEL",
+    "MODEL_ROUTING",
+    "INSTRUCTION_HASHES",
+    "start_workflow_tool",
+    "get_start_workflow_tool",
+    "start_debate_workflow",
+]
 
 # --- CONFIGURATION ---
-# This constant defines which AI model our agents will use
-# Gemini 2.5 Flash is Google's latest fast language model
-GEMINI_MODEL = "gemini-2.5-flash-preview-04-17"
+# Interned and Final so every agent definition shares the same string object
+GEMINI_MODEL: Final[str] = sys.intern("gemini-2.5-flash")
+# Faster, cheaper model for agents that work over short input or over text
+# that earlier agents already produced
+GEMINI_LITE_MODEL: Final[str] = sys.intern("gemini-2.5-flash-lite")
+# Former name of the judge's model, kept for code that imports it
+SUMMARIZATION_MODEL: Final[str] = GEMINI_LITE_MODEL
+
+# Agent names used as transfer targets. Interning guarantees the tools and the
+# agents share one string object, so ADK's name comparison is a pointer check.
+_GREETER = sys.intern("DebateTeamGreeter")
+_WORKFLOW = sys.intern("AIDebateWorkflow")
+
+# Model used by each LLM agent, looked up by agent name in _pick_model.
+# Flash stays on the steps whose quality decides the debate (grounded research
+# and the arguments); greeting, role setup and judging run on Flash-Lite.
+MODEL_ROUTING: Final[dict] = {
+    _GREETER: GEMINI_LITE_MODEL,
+    "RoleAssignmentAgent": GEMINI_LITE_MODEL,
+    "DualStanceResearcher": GEMINI_MODEL,
+    "ProponentDebater": GEMINI_MODEL,
+    "OpponentDebater": GEMINI_MODEL,
+    "DebateJudge": GEMINI_LITE_MODEL,
+}
 
 # --- CUSTOM TOOL FUNCTIONS ---
-# In ADK, we can create custom tools by writing Python functions
-# These functions get special powers through the ToolContext parameter
-
-def return_to_greeter(tool_context: ToolContext) -> dict:
-    """
-    Custom tool that transfers control back to the DebateTeamGreeter agent.
-    
-    This demonstrates ADK's agent transfer capability - agents can hand off
-    control to other agents in the system.
-    
-    Args:
-        tool_context (ToolContext): Special ADK object that provides agent
-                                   control capabilities like transfers
-    
-    Returns:
-        dict: Status message confirming the transfer
-        
-    ADK Pattern Note:
-        - tool_context.actions.transfer_to_agent = "AgentName" causes a transfer
-        - The named agent must exist in the current agent's sub_agents
-    """
-    # This line tells ADK to transfer control to the DebateTeamGreeter agent
-    tool_context.actions.transfer_to_agent = "DebateTeamGreeter"
-    
-    # Return a dictionary with status information
-    # Tools should always return structured data (dict/list/str)
-    return {
-        "status": "success", 
-        "message": "Transferring back to the greeter for the next debate topic."
-    }
-
-def end_debate(tool_context: ToolContext) -> dict:
-    """
-    Custom tool that signals the debate should end due to sufficient coverage.
-    
-    This demonstrates ADK's escalation capability - agents can signal that
-    a loop or process should terminate early.
-    
-    Args:
-        tool_context (ToolContext): Special ADK object that provides agent
-                                   control capabilities like escalation
-    
-    Returns:
-        dict: Status message confirming the debate termination
-        
-    ADK Pattern Note:
-        - tool_context.actions.escalate = True breaks out of LoopAgent iterations
-        - This is how agents can intelligently end iterative processes
-    """
-    # This line tells ADK to escalate (end the current loop/process)
-    tool_context.actions.escalate = True
-    
-    # Return confirmation that the debate has ended
-    return {
-        "status": "debate_ended", 
-        "message": "Debate has reached sufficient depth and coverage."
-    }
+# The tool result is allocated once here instead of building a new dict on
+# every call. Treat it as read-only: the same object is returned to every
+# caller. It stays a plain dict on purpose - ADK only passes dict results through
+# unchanged and wraps anything else (including types.MappingProxyType) as
+# {"result": ...}, which would change what the model sees.
+_START_WORKFLOW_RESULT: Final[dict] = {
+    "status": "success",
+    "message": "Transferring to the debate workflow to begin analysis.",
+}
+
+# === developer notes ===
+# start_debate_workflow is the only custom tool left. Tool docstrings are
+# deliberately one line long: FunctionTool sends them to the model as the
+# tool description. (The judge's old return_to_greeter tool is gone:
+# callbacks.finish_debate posts the follow-up itself, and the runner already
+# sends the next message to the greeter. The debaters' old end_debate tool is
+# gone too: they end the loop with the [[END_DEBATE]] marker, which
+# callbacks.record_debate_round turns into an escalation.)
+#
+# start_debate_workflow (agent transfer):
+#   - tool_context.actions.transfer_to_agent = "AgentName" causes a transfer
+#   - The named agent must exist somewhere in the agent tree
+#   - Stores the topic as state["debate_topic"] for the workflow (and its cache)
+#   - Hands the conversation from the greeter to the AIDebateWorkflow sub-agent
+#
+# FunctionTool takes the tool name from __name__ and the description from
+# __doc__, so __doc__ is assigned explicitly (which also keeps it under
+# python -OO). The name must stay exactly as it is because the greeter's
+# instruction tells the model to call it. It returns a small status dict
+# because tools should always return structured data (dict/list/str).
+# =========================
+
+def start_debate_workflow(topic: str, tool_context: "ToolContext") -> dict:
+    tool_context.state["debate_topic"] = topic
+    tool_context.actions.transfer_to_agent = _WORKFLOW
+    return _START_WORKFLOW_RESULT
+
+
+start_debate_workflow.__doc__ = (
+    "Transfers control to the AIDebateWorkflow to debate the given topic."
+)
 
 # --- TOOL CREATION ---
-# Convert our Python functions into ADK tools that agents can use
-# FunctionTool wraps a Python function and makes it available to agents
-transfer_tool = FunctionTool(func=return_to_greeter)
-end_debate_tool = FunctionTool(func=end_debate)
-
-# Tool for transferring to the debate workflow
-def start_debate_workflow(tool_context: ToolContext) -> dict:
-    """Transfers control to the AIDebateWorkflow to begin the debate process.
-    
-    Returns:
-        dict: Confirmation of transfer to debate workflow
-    """
-    tool_context.actions.transfer_to_agent = "AIDebateWorkflow"
-    return {
-        "status": "success", 
-        "message": "Transferring to the debate workflow to begin analysis."
-    }
-
-start_workflow_tool = FunctionTool(func=start_debate_workflow)
+# The FunctionTool is built on the first call to its getter (not at import)
+# and functools.cache returns the same instance on every later call. It is a
+# CachedFunctionTool, which also builds its function declaration only once
+# instead of on every model request.
+@cache
+def get_start_workflow_tool():
+    """Returns the shared FunctionTool wrapping start_debate_workflow."""
+    from .tools import CachedFunctionTool
 
-# =============================================================================
-# AGENT DEFINITIONS
-# =============================================================================
-# Each agent is an LlmAgent with specific instructions and capabilities
-# The instruction field is like a detailed prompt that defines the agent's role
+    return CachedFunctionTool(func=start_debate_workflow)
 
-# --- 1. ROLE ASSIGNMENT AGENT ---
-# This agent analyzes a debate topic and defines clear positions for both sides
-role_assignment_agent = LlmAgent(
-    # Name: Unique identifier for this agent in the system
-    name="RoleAssignmentAgent",
-    
-    # Model: Which AI model to use (defined in our constant above)
-    model=GEMINI_MODEL,
-    
-    # Instruction: The "prompt" that defines this agent's behavior and role
-    # {debate_topic} is a template variable that gets filled in at runtime
-    instruction="""You define the debate positions for a given topic.
 
-You will receive a debate topic from the previous agent. Your task is to:
-1. Analyze the topic and rephrase it into a clear, debatable question if needed
-2. Define two distinct positions: Proponent (FOR) and Opponent (AGAINST)  
-3. Outline the main argument for each side (1-2 sentences each)
+# The module-level __getattr__ (PEP 562) serves root_agent lazily, and maps the
+# old module attribute (agent.start_workflow_tool) onto its getter so external
+# code that imported them keeps working.
+_TOOL_ALIASES = {
+    "start_workflow_tool": get_start_workflow_tool,
+}
 
-The debate topic will be provided in the conversation context from the previous agent interaction.
 
-<br><br>
+def __getattr__(name):
+    # root_agent is what ADK (adk web, AdkApp) looks for in this module. The
+    # whole agent graph is built on first access and then stored as a real
+    # global, so "from debate_team.agent import root_agent" still works but
+    # a plain "import debate_team.agent" constructs no agents at all.
+    if name == "root_agent":
+        agent = globals()["root_agent"] = build_root_agent()
+        return agent
+    getter = _TOOL_ALIASES.get(name)
+    if getter is not None:
+        return getter()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-## 📋 **DEBATE SETUP**
 
-<br>
+def __dir__():
+    # Keep dir() and tab-completion aware of the not-yet-built tools
+    return sorted(set(globals()) | set(__all__))
 
-**Debate Topic:** [Restate the topic clearly]<br>
-**Debate Question:** [Clear, focused debate question]<br><br>
 
-**Proponent Position:** [What they argue FOR]<br>
-**Proponent Main Argument:** [Their core reasoning]<br><br>
+# =============================================================================
+# AGENT INSTRUCTIONS
+# =============================================================================
+# Each instruction is the "prompt" that defines an agent's behavior and role.
+# They contain no <br> presentation tags; the display spacing is added to the
+# model's output by callbacks.add_display_line_breaks instead.
+# Template variables like {role_assignments} are filled in by ADK at runtime
+# with the output_key values written by earlier agents in the workflow. They
+# only ever appear in a trailing block that starts with _CONTEXT_MARKER, after
+# all of the fixed text, so everything before the marker is the same bytes on
+# every call.
+_CONTEXT_MARKER: Final[str] = "---\nCONTEXT:\n"
+
+ROLE_ASSIGNMENT_INSTRUCTION = """You define the debate positions for a given topic.
 
-**Opponent Position:** [What they argue AGAINST]<br>  
-**Opponent Main Argument:** [Their core reasoning]<br><br>
+You will receive a debate topic from the previous agent. Your task is to:
+1. Analyze the topic and rephrase it into a clear, debatable question if needed
+2. Define two distinct positions: Proponent (FOR) and Opponent (AGAINST)  
+3. Outline the main argument for each side (1-2 sentences each)
 
-Be clear and balanced in defining both positions.<br><br>""",
-    
-    # Description: Human-readable description of what this agent does
-    description="Defines Proponent and Opponent roles and their main arguments for the debate topic.",
-    
-    # Output_key: This is crucial! It defines what variable name this agent's
-    # output will be stored under for use by other agents in the workflow
-    output_key="role_assignments"
-)
+The debate topic will be provided in the conversation context from the previous agent interaction.
 
-# --- 2. RESEARCH AGENTS ---
-# These agents use Google Search to find supporting evidence for each debate position
-# Notice how they reference {role_assignments} - this comes from the agent above
+Answer with a JSON object with these fields:
+- topic: the topic, restated clearly
+- debate_question: a clear, focused debate question
+- proponent_position: what the Proponent argues FOR
+- proponent_main_argument: the Proponent's core reasoning
+- opponent_position: what the Opponent argues AGAINST
+- opponent_main_argument: the Opponent's core reasoning
 
-proponent_researcher = LlmAgent(
-    name="ProponentResearcher",
-    model=GEMINI_MODEL,
-    
-    # This instruction shows how agents can reference outputs from previous agents
-    # {role_assignments} gets filled with the output from role_assignment_agent
-    instruction="""You research supporting evidence for the Proponent position in the debate.
+Be clear and balanced in defining both positions."""
 
-Role Assignments: {role_assignments}
+DUAL_STANCE_RESEARCHER_INSTRUCTION = """You research supporting evidence for BOTH positions in the debate.
 
-Look at the role assignments and find 2-3 strong supporting points, facts, or examples that support the Proponent's stance. Use Google Search to find current, credible information.
+Look at the role assignments and find 2-3 strong supporting points, facts, or examples for the Proponent's stance AND 2-3 for the Opponent's stance. Use Google Search to find current, credible information for each side. Research each side as its strongest advocate would.
 
-<br><br>
+Write the Proponent section first and the Opponent section second, using exactly the two headings below. Do not add any text after the Opponent section's sources.
 
 ## 🟢 **PROPONENT RESEARCH FINDINGS**
 
-<br>
-
 Focus on:
-- Statistical evidence<br>
-- Expert opinions<br>  
-- Real-world examples<br>
-- Research findings<br><br>
-
-Summarize your findings concisely but persuasively.<br><br>  
-
-### 📚 **Key Reference Articles (List of Key Sources):**<br>
-For each significant article/document used:<br>
-* <a href="[Full URL]" target="_blank">[Article Title]</a><br><br>""",
-    
-    # Tools: List of tools this agent can use
-    # google_search is a built-in ADK tool for web searches
-    tools=[google_search],
-    
-    description="Researches supporting points for the Proponent's stance.",
-    
-    # This agent's output will be available as {proponent_research_findings}
-    output_key="proponent_research_findings"
-)
+- Statistical evidence
+- Expert opinions
+- Real-world examples
+- Research findings
 
-opponent_researcher = LlmAgent(
-    name="OpponentResearcher", 
-    model=GEMINI_MODEL,
-    
-    # Nearly identical to proponent_researcher but focuses on the opposing side
-    instruction="""You research supporting evidence for the Opponent position in the debate.
+Summarize your findings concisely but persuasively.
 
-Role Assignments: {role_assignments}
-
-Look at the role assignments and find 2-3 strong supporting points, facts, or examples that support the Opponent's stance. Use Google Search to find current, credible information.
-
-<br><br>
+### 📚 **Key Reference Articles (List of Key Sources):**
+For each significant article/document used:
+* <a href="[Full URL]" target="_blank">[Article Title]</a>
 
 ## 🔴 **OPPONENT RESEARCH FINDINGS**
 
-<br>
-
 Focus on:
-- Statistical evidence<br>
-- Expert opinions<br>
-- Real-world examples<br>  
-- Research findings<br><br>
-
-Summarize your findings concisely but persuasively.<br><br>  
-
-### 📚 **Key Reference Articles (List of Key Sources):**<br>
-For each significant article/document used:<br>
-* <a href="[Full URL]" target="_blank">[Article Title]</a><br><br>""",
-    
-    # Same tools as proponent_researcher
-    tools=[google_search],
-    
-    description="Researches supporting points for the Opponent's stance.",
-    
-    # This agent's output will be available as {opponent_research_findings}
-    output_key="opponent_research_findings"
-)
-
-# --- 3. PARALLEL RESEARCH COORDINATOR ---
-# ParallelAgent runs multiple sub-agents at the same time (concurrently)
-# This is more efficient than running researchers one after another
-parallel_stance_researcher = ParallelAgent(
-    name="ParallelStanceResearcher",
-    description="Researches supporting evidence for both debate positions concurrently.",
-    
-    # Sub_agents: List of agents to run in parallel
-    # Both researchers will run simultaneously, saving time
-    sub_agents=[proponent_researcher, opponent_researcher]
-    
-    # ADK Pattern Note: ParallelAgent collects outputs from all sub-agents
-    # So we'll have both {proponent_research_findings} and {opponent_research_findings}
-    # available to subsequent agents in the workflow
-)
-
-# --- 4. INDIVIDUAL DEBATER AGENTS FOR LOOP ITERATION ---
-# These agents will engage in back-and-forth debate rounds
-# They're designed to work within a LoopAgent for iterative interaction
+- Statistical evidence
+- Expert opinions
+- Real-world examples
+- Research findings
+
+Summarize your findings concisely but persuasively.
+
+### 📚 **Key Reference Articles (List of Key Sources):**
+For each significant article/document used:
+* <a href="[Full URL]" target="_blank">[Article Title]</a>
+
+""" + _CONTEXT_MARKER + """Role Assignments: {role_assignments}"""
+
+# Static text comes first and the {template} inputs come last in every
+# instruction, so the start of each prompt is byte-identical from call to call
+# and Gemini's implicit prompt caching can reuse it. Both debaters open with the
+# same shared rules for the same reason.
+#
+# The debaters run with include_contents="none": instead of the whole
+# conversation history (which holds both sides' full research), each one gets
+# exactly what it needs in its CONTEXT block - the role assignments, its own
+# side's full research, a short brief of the other side's research, and the
+# rounds so far. The research part of that block is the same on every
+# iteration, so only the transcript at the very end grows from round to round.
+_DEBATER_RULES = """You are a debater in an iterative debate. Each turn is a single round in an ongoing debate: make ONE strong argument for your side.
+
+- Use your research evidence effectively
+- Be persuasive but concise (2-3 sentences)
+- Stay focused on your assigned position
+- If previous rounds have occurred, build on and respond to the discussion naturally
 
-proponent_debater = LlmAgent(
-    name="ProponentDebater",
-    model=GEMINI_MODEL,
-    
-    # This instruction shows how agents can access multiple previous outputs
-    # Notice {role_assignments}, {proponent_research_findings}, and {opponent_research_findings}
-    instruction="""You are the PROPONENT debater in an iterative debate.
+If this feels like an advanced round (after several exchanges) and you believe the key points have been thoroughly covered from both sides, you may conclude the discussion by ending your response with [[END_DEBATE]] on its own line.
+"""
 
-**Role Context:**
-{role_assignments}
+PROPONENT_DEBATER_INSTRUCTION = _DEBATER_RULES + """
+**Your Side:** You are the PROPONENT. Argue FOR the position defined in the role assignments below, using your research (the opponent's research brief shows what you are up against).
 
-**Your Research:**
-{proponent_research_findings}
+**IMPORTANT:** Start your response with "🟢 **PROPONENT:**" to clearly identify your role.
 
-**Opponent's Research (for context):**
-{opponent_research_findings}
+Format:
 
-**Your Task:**
-Make ONE strong argument FOR your position. This is a single round in an ongoing debate.
+🟢 **PROPONENT:**
+[Your clear, persuasive argument]
 
-**IMPORTANT:** Start your response with "🟢 **PROPONENT:**" to clearly identify your role.
+""" + _CONTEXT_MARKER + """Role Assignments: {role_assignments}
+Your Research: {proponent_research_findings}
+Opponent Research Brief:
+{opponent_research_brief}
+Debate So Far:
+{debate_rounds}"""
 
-- Use your research evidence effectively  
-- Be persuasive but concise (2-3 sentences)
-- Stay focused on your PRO position
-- If previous rounds have occurred, build on the discussion naturally
+OPPONENT_DEBATER_INSTRUCTION = _DEBATER_RULES + """
+**Your Side:** You are the OPPONENT. Argue AGAINST the position defined in the role assignments below, using your research (the proponent's research brief shows what you are up against).
 
-If this feels like an advanced round (after several exchanges) and you believe the key points have been thoroughly covered from both sides, you may call the 'end_debate' tool to conclude the discussion.
+**IMPORTANT:** Start your response with "🔴 **OPPONENT:**" to clearly identify your role.
 
 Format:
-<br><br>  
-🟢 **PROPONENT:**<br>  
-[Your clear, persuasive argument]<br><br>""",
-    
-    description="Makes individual pro arguments in the iterative debate.",
-    
-    # This agent can use the end_debate tool to terminate the loop early
-    tools=[end_debate_tool],
-    
-    # All debater outputs use the same key - this creates a conversation thread
-    output_key="current_round"
-)
 
-opponent_debater = LlmAgent(
-    name="OpponentDebater", 
-    model=GEMINI_MODEL,
-    
-    # Similar to proponent_debater but argues the opposing position
-    instruction="""You are the OPPONENT debater in an iterative debate.
+🔴 **OPPONENT:**
+[Your clear, persuasive counter-argument]
 
-**Role Context:**
-{role_assignments}
+""" + _CONTEXT_MARKER + """Role Assignments: {role_assignments}
+Your Research: {opponent_research_findings}
+Proponent Research Brief:
+{proponent_research_brief}
+Debate So Far:
+{debate_rounds}"""
 
-**Your Research:**
-{opponent_research_findings}
+DEBATE_JUDGE_INSTRUCTION = """You are the strategic debate analyst AND the final judge of the iterative debate.
 
-**Proponent's Research (for context):**
-{proponent_research_findings}
+Write your response in exactly two parts, in this order, using the two headings below:
+1. The STRATEGIC DEBATE ANALYSIS: deep insights into the debate performance
+2. The FINAL DEBATE JUDGMENT: make the FINAL CALL and provide decisive conclusions based on your analysis - NOT a repeat of it
 
-**Your Task:**
-Make ONE strong argument AGAINST the position. This is a single round in an ongoing debate.
+🎯 **STRATEGIC DEBATE ANALYSIS**
 
-**IMPORTANT:** Start your response with "🔴 **OPPONENT:**" to clearly identify your role.
+### **1. Argument Strength Assessment**
+- Rate each side's strongest and weakest arguments (1-10 scale)
+- Identify which evidence was most/least compelling
+- Note any logical fallacies or reasoning gaps
 
-- Use your research evidence strategically
-- Be persuasive but concise (2-3 sentences)  
-- Stay focused on your AGAINST position
-- If previous rounds have occurred, respond to the discussion naturally
+### **2. Tactical Performance**
+- **Proponent Strategy:** How effectively did they advance their position?
+- **Opponent Strategy:** How well did they counter and create doubt?
+- **Missed Opportunities:** What stronger arguments could each side have made?
 
-If this feels like an advanced round (after several exchanges) and you believe the key points have been thoroughly covered from both sides, you may call the 'end_debate' tool to conclude the discussion.
+### **3. Evidence Utilization**
+- Which research findings were used most effectively?
+- What supporting evidence went unused?
+- Were there any unsupported claims?
 
-Format:
-<br><br>   
-🔴 **OPPONENT:**<br>      
-[Your clear, persuasive counter-argument]<br><br>""",
-    
-    description="Makes individual opposing arguments in the iterative debate.",
-    
-    # Both debaters can end the debate when they feel it's complete
-    tools=[end_debate_tool],
-    
-    # Same output_key as proponent - creates a shared conversation thread
-    output_key="current_round"
-)
+### **4. Debate Flow & Momentum**
+- **Opening Round:** Who established stronger initial framing?
+- **Middle Rounds:** Where did momentum shift and why?
+- **Closing Rounds:** Who delivered more compelling final arguments?
 
-# --- 5. LOOP AGENT FOR ITERATIVE DEBATE ROUNDS ---
-# LoopAgent repeatedly cycles through its sub-agents until stopped
-# This creates the back-and-forth debate dynamic
-iterative_debate_loop = LoopAgent(
-    name="IterativeDebateLoop",
-    description="Conducts real iterative debate rounds between Proponent and Opponent agents.",
-    
-    # Sub_agents: The agents that will alternate in the loop
-    # Order matters! Proponent goes first, then Opponent, then repeat
-    sub_agents=[proponent_debater, opponent_debater],
-    
-    # Max_iterations: Safety limit to prevent infinite loops
-    # With 2 agents, this allows 4 rounds each (8 total exchanges)
-    max_iterations=8
-    
-    # ADK Pattern Note: LoopAgent will continue until:
-    # 1. max_iterations is reached, OR
-    # 2. An agent calls tool_context.actions.escalate = True (our end_debate tool)
-)
+### **5. Critical Turning Points**
+- Identify 1-2 moments that changed the debate trajectory
+- Explain what made these exchanges particularly effective
 
-# --- 6. DEBATE STRATEGIC ANALYST ---
-# This agent provides deep analysis of the debate performance and strategy instead of just regurgitating rounds
-debate_aggregator = LlmAgent(
-    name="DebateStrategicAnalyst",
-    model=GEMINI_MODEL,
-    
-    # This agent analyzes the debate rounds for strategic insights and quality assessment
-    instruction="""You are a strategic debate analyst providing deep insights into the iterative debate performance.
-
-**Available Information:**
-Role Context: {role_assignments}
-Proponent Research: {proponent_research_findings}
-Opponent Research: {opponent_research_findings}
-Debate Rounds: {current_round}
-
-**Your Analysis Task:**<br>
-Provide a strategic analysis of the debate performance with these key insights:<br><br>
-
-<br><br> 🎯 **STRATEGIC DEBATE ANALYSIS**
-
-<br>
-
-### **1. Argument Strength Assessment**<br>
-- Rate each side's strongest and weakest arguments (1-10 scale)<br>
-- Identify which evidence was most/least compelling<br>
-- Note any logical fallacies or reasoning gaps<br><br>
-
-### **2. Tactical Performance**<br>
-- **Proponent Strategy:** How effectively did they advance their position?<br>
-- **Opponent Strategy:** How well did they counter and create doubt?<br>
-- **Missed Opportunities:** What stronger arguments could each side have made?<br><br>
-
-### **3. Evidence Utilization**<br>
-- Which research findings were used most effectively?<br>
-- What supporting evidence went unused?<br>
-- Were there any unsupported claims?<br><br>
-
-### **4. Debate Flow & Momentum**<br>
-- **Opening Round:** Who established stronger initial framing?<br>
-- **Middle Rounds:** Where did momentum shift and why?<br>
-- **Closing Rounds:** Who delivered more compelling final arguments?<br><br>
-
-### **5. Critical Turning Points**<br>
-- Identify 1-2 moments that changed the debate trajectory<br>
-- Explain what made these exchanges particularly effective<br><br>
-
-### **6. Debate Quality Metrics**<br>
-- **Depth:** How thoroughly were key issues explored? (1-10)<br>
-- **Nuance:** Did arguments acknowledge complexity? (1-10)<br>
-- **Civility:** Professional tone and respectful disagreement? (1-10)<br>
-- **Innovation:** Any surprising or creative arguments? (1-10)<br><br>
-
-### **7. Strategic Recommendations**<br>
-- What would strengthen the Proponent's case in future debates?<br>
-- How could the Opponent improve their counter-arguments?<br>
-- What additional evidence or angles would be valuable?<br><br>
-
-**Format Guidelines:**<br>
-- Use clear headings with emojis for readability<br>
-- Include specific examples from the debate rounds<br>
-- Provide numerical ratings where indicated<br>
-- Be objective but insightful - help users understand argumentation effectiveness<br>
-- Focus on strategic analysis, not just content repetition<br><br>""",
-    
-    description="Analyzes debate strategy, argument strength, and provides tactical insights rather than just reformatting rounds.",
-    
-    # Output becomes available as {debate_analysis} for the final summary
-    output_key="debate_analysis"
-)
+### **6. Debate Quality Metrics**
+- **Depth:** How thoroughly were key issues explored? (1-10)
+- **Nuance:** Did arguments acknowledge complexity? (1-10)
+- **Civility:** Professional tone and respectful disagreement? (1-10)
+- **Innovation:** Any surprising or creative arguments? (1-10)
 
-# --- 7. DEBATE SUMMARIZER ---
-# The final agent that creates a comprehensive summary and returns control
-debate_summarizer = LlmAgent(
-    name="DebateSummarizerAgent", 
-    model=GEMINI_MODEL,
-    
-    # This agent has access to ALL previous outputs from the entire workflow
-    instruction="""You are the final judge who declares the debate winner and provides conclusive takeaways.
+### **7. Strategic Recommendations**
+- What would strengthen the Proponent's case in future debates?
+- How could the Opponent improve their counter-arguments?
+- What additional evidence or angles would be valuable?
 
-Based on the strategic analysis provided, your job is to make the FINAL CALL and provide decisive conclusions - NOT to repeat the detailed analysis.<br><br>
+**Format Guidelines:**
+- Use clear headings with emojis for readability
+- Include specific examples from the debate rounds
+- Provide numerical ratings where indicated
+- Be objective but insightful - help users understand argumentation effectiveness
+- Focus on strategic analysis, not just content repetition
 
-Available Information:<br>
-- Role Assignments: {role_assignments}<br>
-- Strategic Analysis: {debate_analysis}<br><br>
+🏆 **FINAL DEBATE JUDGMENT**
 
-<br><br> 🏆 **FINAL DEBATE JUDGMENT**
+Your task is to provide a crisp, decisive conclusion:
 
-<br>
+### **🥇 DEBATE WINNER**
+**Winner:** [Proponent OR Opponent]
+**Margin of Victory:** [Decisive/Clear/Narrow]
+**Key Reason for Victory:** [1-2 sentences explaining why they won]
 
-Your task is to provide a crisp, decisive conclusion:<br><br>
+### **⚡ DECISIVE MOMENTS**
+**Game-Changer:** [The single most impactful argument or exchange]
+**Turning Point:** [When momentum shifted decisively]
 
-### **🥇 DEBATE WINNER**<br>
-**Winner:** [Proponent OR Opponent]<br>
-**Margin of Victory:** [Decisive/Clear/Narrow]<br>
-**Key Reason for Victory:** [1-2 sentences explaining why they won]<br><br>
+### **🎯 PERFORMANCE GRADES**
+**Proponent Overall:** [A-F grade] - [One sentence why]
+**Opponent Overall:** [A-F grade] - [One sentence why]
 
-### **⚡ DECISIVE MOMENTS**<br>
-**Game-Changer:** [The single most impactful argument or exchange]<br>
-**Turning Point:** [When momentum shifted decisively]<br><br>
+### **💡 KEY TAKEAWAYS**
+**For the Topic:** [What did this debate reveal about the issue?]
+**For Future Debaters:** [One key lesson for improving arguments]
+**Most Compelling Evidence:** [What research/data was most persuasive?]
 
-### **🎯 PERFORMANCE GRADES**<br>
-**Proponent Overall:** [A-F grade] - [One sentence why]<br>
-**Opponent Overall:** [A-F grade] - [One sentence why]<br><br>
+### **🔥 DEBATE HIGHLIGHTS**
+**Best Proponent Moment:** [Their strongest argument]
+**Best Opponent Moment:** [Their strongest counter]
+**Missed Opportunity:** [What could have changed the outcome?]
 
-### **💡 KEY TAKEAWAYS**<br>
-**For the Topic:** [What did this debate reveal about the issue?]<br>
-**For Future Debaters:** [One key lesson for improving arguments]<br>
-**Most Compelling Evidence:** [What research/data was most persuasive?]<br><br>
+**JUDGE'S FINAL VERDICT:** [2-3 sentences wrapping up why this winner deserved victory and what made this debate valuable]
 
-### **🔥 DEBATE HIGHLIGHTS**<br>
-**Best Proponent Moment:** [Their strongest argument]<br>
-**Best Opponent Moment:** [Their strongest counter]<br>
-**Missed Opportunity:** [What could have changed the outcome?]<br><br>
+**Important:** Be decisive! Make clear judgments based on your strategic analysis above. Don't hedge or repeat the analysis - provide conclusions and call a winner!
 
-**JUDGE'S FINAL VERDICT:** [2-3 sentences wrapping up why this winner deserved victory and what made this debate valuable]<br><br>
 
-**Important:** Be decisive! Make clear judgments based on the strategic analysis. Don't hedge or repeat analysis - provide conclusions and call a winner!<br><br>
-
-After providing your judgment, use the 'return_to_greeter' tool to transfer control back to the DebateTeamGreeter.<br><br>""",
-    
-    description="Final judge who declares the debate winner and provides decisive conclusions without repeating analysis.",
-    
-    output_key="final_debate_summary",
-    
-    # This agent uses the transfer tool to return control to the greeter
-    tools=[transfer_tool]
-)
-
-# --- 8. ENHANCED SEQUENTIAL DEBATE WORKFLOW ---
-# SequentialAgent runs sub-agents one after another in a specific order
-# This creates our main debate pipeline
-debate_workflow = SequentialAgent(
-    name="AIDebateWorkflow",
-    description="Executes the complete iterative debate process using LoopAgent for real debate rounds.",
-    
-    # Sub_agents: The complete workflow pipeline in order
-    sub_agents=[
-        role_assignment_agent,      # Step 1: Define debate positions  
-        parallel_stance_researcher, # Step 2: Research both sides (in parallel)
-        iterative_debate_loop,     # Step 3: Conduct iterative debate rounds
-        debate_aggregator,         # Step 4: Analyze debate strategy and effectiveness
-        debate_summarizer          # Step 5: Create final summary integrating strategic insights
-    ]
-    
-    # ADK Pattern Note: Each agent in the sequence has access to outputs
-    # from all previous agents through template variables like {role_assignments}
-)
+""" + _CONTEXT_MARKER + """Role Context: {role_assignments}
+Proponent Research: {proponent_research_findings}
+Opponent Research: {opponent_research_findings}
+Debate Rounds:
+{debate_rounds}"""
 
-# --- 9. GREETER (ROOT AGENT) ---
-# This is the main entry point - the agent users interact with first
-# It handles greetings, topic collection, and workflow coordination
-root_agent = LlmAgent(
-    name="DebateTeamGreeter",
-    model=GEMINI_MODEL,
-    
-    # Tools: The greeter can use the start_workflow_tool to transfer to the debate team
-    tools=[start_workflow_tool],
-    
-    # This instruction handles multiple conversation states and demonstrates
-    # agent transfer patterns
-    instruction="""You are the welcoming host for an advanced AI Debate Team featuring ITERATIVE DEBATE ROUNDS.
+GREETER_INSTRUCTION = """You are the welcoming host for an advanced AI Debate Team featuring ITERATIVE DEBATE ROUNDS.
 
 Your job is to identify debate topics and initiate the debate workflow. Be flexible with user input:
 
@@ -544,8 +375,7 @@ Your job is to identify debate topics and initiate the debate workflow. Be flexi
 2. **If you can identify ANY debate topic** from the input (regardless of how it's phrased):
    - Extract the core topic from their message  
    - Say: "Excellent! Let's conduct an iterative debate on: [TOPIC]"
-   - Output the topic on the final line for capture
-   - Use the 'start_debate_workflow' tool to transfer to the debate team
+   - Use the 'start_debate_workflow' tool with the extracted topic as its `topic` argument to transfer to the debate team
 
 3. **If returning after a debate summary**:
    - Thank them for the engaging iterative debate
@@ -553,12 +383,12 @@ Your job is to identify debate topics and initiate the debate workflow. Be flexi
    - When they provide a new topic, treat it as case 2
 
 **TOPIC EXTRACTION EXAMPLES:**
-- Input: "renewable energy" → Output ends with: "renewable energy"
-- Input: "Should we use nuclear power?" → Output ends with: "nuclear power"  
-- Input: "I want to debate climate change vs economic growth" → Output ends with: "climate change vs economic growth"
-- Input: "artificial intelligence ethics" → Output ends with: "artificial intelligence ethics"
-- Input: "space exploration is important" → Output ends with: "space exploration"
-- Input: "the best pet" → Output ends with: "the best pet"
+- Input: "renewable energy" → topic: "renewable energy"
+- Input: "Should we use nuclear power?" → topic: "nuclear power"  
+- Input: "I want to debate climate change vs economic growth" → topic: "climate change vs economic growth"
+- Input: "artificial intelligence ethics" → topic: "artificial intelligence ethics"
+- Input: "space exploration is important" → topic: "space exploration"
+- Input: "the best pet" → topic: "the best pet"
 
 **OUTPUT FORMAT EXAMPLE:**
 "Excellent! Let's conduct an iterative debate on nuclear power!
@@ -571,31 +401,340 @@ I'm now transferring this topic to our debate workflow team.  "
 - Transfer to AIDebateWorkflow as soon as you have a clear topic
 - Don't require users to say hello first - if they give a topic directly, go with it!
 
-Be conversational and emphasize the iterative, back-and-forth nature of the debate system.""",
-    
-    description="Greets users, introduces the iterative debate process, transfers to workflow, and handles follow-ups.",
-    
-    # The topic provided by the user becomes available as {debate_topic}
-    output_key="debate_topic",
-    
-    # Sub_agents: The greeter can transfer control to the full workflow
-    sub_agents=[debate_workflow]
-    
-    # ADK Pattern Note: When this agent transfers to AIDebateWorkflow,
-    # the workflow agents will have access to {debate_topic} from this agent's output
-)
+Be conversational and emphasize the iterative, back-and-forth nature of the debate system."""
+
+# --- CANONICAL INSTRUCTION TEXT ---
+# Implicit prompt caching only hits when the prompt's leading bytes are
+# identical, so every instruction is normalized once at import (trailing spaces
+# removed, one final newline). Editor reformatting of this file can then no
+# longer change what is sent. The SHA-256 of each instruction's static prefix
+# (the text before _CONTEXT_MARKER) is kept per agent and logged at DEBUG level,
+# so a drop in cache hits can be matched to a prompt change.
+def _canonicalize(text):
+    """Normalizes line endings and trailing whitespace of an instruction."""
+    return "\n".join(line.rstrip() for line in text.splitlines()).strip() + "\n"
+
+
+ROLE_ASSIGNMENT_INSTRUCTION = _canonicalize(ROLE_ASSIGNMENT_INSTRUCTION)
+DUAL_STANCE_RESEARCHER_INSTRUCTION = _canonicalize(DUAL_STANCE_RESEARCHER_INSTRUCTION)
+PROPONENT_DEBATER_INSTRUCTION = _canonicalize(PROPONENT_DEBATER_INSTRUCTION)
+OPPONENT_DEBATER_INSTRUCTION = _canonicalize(OPPONENT_DEBATER_INSTRUCTION)
+DEBATE_JUDGE_INSTRUCTION = _canonicalize(DEBATE_JUDGE_INSTRUCTION)
+GREETER_INSTRUCTION = _canonicalize(GREETER_INSTRUCTION)
+
+INSTRUCTION_HASHES: Final[dict] = {
+    agent_name: hashlib.sha256(text.split(_CONTEXT_MARKER)[0].encode("utf-8")).hexdigest()
+    for agent_name, text in (
+        ("RoleAssignmentAgent", ROLE_ASSIGNMENT_INSTRUCTION),
+        ("DualStanceResearcher", DUAL_STANCE_RESEARCHER_INSTRUCTION),
+        ("ProponentDebater", PROPONENT_DEBATER_INSTRUCTION),
+        ("OpponentDebater", OPPONENT_DEBATER_INSTRUCTION),
+        ("DebateJudge", DEBATE_JUDGE_INSTRUCTION),
+        (_GREETER, GREETER_INSTRUCTION),
+    )
+}
+for _agent_name, _digest in INSTRUCTION_HASHES.items():
+    logger.debug("instruction sha256 %s=%s", _agent_name, _digest)
 
 # =============================================================================
-# SUMMARY OF ADK PATTERNS DEMONSTRATED
+# AGENT DEFINITIONS
 # =============================================================================
-# 1. LlmAgent: Individual AI agents with specific roles and instructions
-# 2. SequentialAgent: Run agents in order (pipeline pattern)
-# 3. ParallelAgent: Run agents simultaneously (efficiency pattern)
-# 4. LoopAgent: Run agents repeatedly (iteration pattern)
-# 5. FunctionTool: Custom Python functions as agent capabilities
-# 6. Agent Transfer: Hand off control between agents
-# 7. Escalation: Early termination of loops/processes
-# 8. Template Variables: Share data between agents using {variable_name}
-# 9. Output Keys: Define how agent outputs become available to others
-# 10. Tool Context: Special capabilities for agent control and coordination
-# =============================================================================
\ No newline at end of file
+# Each agent comes from its own @cache factory, so it is constructed once, on
+# first use, and only when something actually needs it. Every agent whose
+# instruction describes a formatted layout gets add_display_line_breaks as its
+# after_model_callback, which adds the <br> display spacing to its replies, and
+# every agent that reads earlier replies from state gets
+# strip_display_line_breaks, which keeps those tags out of its prompt. The ADK classes are
+# imported inside the factories for the same reason. An ADK agent can only have
+# one parent, which is why every factory returns a single shared instance.
+
+# --- SHARED MODEL CLIENTS ---
+# When an LlmAgent is given a model *name*, ADK creates a fresh Gemini wrapper -
+# and with it a new google-genai Client and HTTP connection pool - every time
+# the agent calls the model. Passing one Gemini instance per model name instead
+# lets every agent reuse the same client, so connections (and their TLS
+# handshakes) are shared across agents and across loop iterations. The client
+# itself is kept per running event loop (see rate_limit.py), because Agent
+# Engine runs every query on a new loop and connections cannot outlive the
+# loop that opened them. The wrapper
+# also paces calls to the quota set in DEBATE_TEAM_GEMINI_RPM / _TPM and
+# retries 429/503 responses (see rate_limit.py).
+@cache
+def _model(name):
+    """Returns the shared Gemini wrapper for a model name."""
+    from .rate_limit import RateLimitedGemini
+
+    return RateLimitedGemini(model=name)
+
+
+def _pick_model(agent_name):
+    """Returns the shared model wrapper MODEL_ROUTING assigns to an agent."""
+    return _model(MODEL_ROUTING.get(agent_name, GEMINI_MODEL))
+
+
+# --- 1. ROLE ASSIGNMENT AGENT ---
+@cache
+def _role_assignment_agent():
+    """Defines the Proponent and Opponent positions for the topic."""
+    from google.adk.agents import LlmAgent
+
+    from .cache import store_role_assignments, use_cached_role_assignments
+    from .callbacks import render_role_assignments, request_role_json
+
+    # Repeat topics are answered from the role-assignment cache without
+    # calling the model. The model answers in JSON (RoleAssignments); the
+    # after-model callback keeps the parsed fields in state["debate_roles"]
+    # and turns the reply into the DEBATE SETUP markdown that users see and
+    # that later agents read as {role_assignments}. The schema is set by a
+    # before-model callback rather than output_schema, because output_schema
+    # would make ADK parse the rendered markdown back as JSON for output_key.
+    return LlmAgent(
+        name="RoleAssignmentAgent",
+        model=_pick_model("RoleAssignmentAgent"),
+        instruction=ROLE_ASSIGNMENT_INSTRUCTION,
+        description="Defines Proponent and Opponent roles and their main arguments for the debate topic.",
+        output_key="role_assignments",
+        before_agent_callback=use_cached_role_assignments,
+        after_agent_callback=store_role_assignments,
+        before_model_callback=request_role_json,
+        after_model_callback=render_role_assignments
+    )
+
+
+# --- 2. DUAL STANCE RESEARCHER ---
+@cache
+def _dual_stance_researcher():
+    """Researches both sides of the debate in a single grounded call."""
+    from google.adk.agents import LlmAgent
+    from google.adk.tools import google_search
+
+    from .cache import use_cached_research
+    from .callbacks import (
+        add_display_line_breaks,
+        finish_research,
+        strip_display_line_breaks,
+    )
+
+    # One Gemini call researches both sides of {role_assignments} with Google
+    # Search. The after-agent callback splits the response at the opponent
+    # heading into proponent_research_findings and opponent_research_findings,
+    # the keys the debaters and judge read. (A JSON response schema is not
+    # used because Gemini cannot combine structured output with tool calls.)
+    # google_search is Gemini's built-in grounding tool: the searches run inside
+    # the model call on Google's side, so there is no client-side HTTP here to
+    # batch or parallelize. Role assignments that closely match an earlier
+    # debate's reuse its research from the research cache instead.
+    return LlmAgent(
+        name="DualStanceResearcher",
+        model=_pick_model("DualStanceResearcher"),
+        instruction=DUAL_STANCE_RESEARCHER_INSTRUCTION,
+        tools=[google_search],
+        description="Researches supporting points for both the Proponent's and the Opponent's stance.",
+        output_key="dual_research_findings",
+        before_agent_callback=use_cached_research,
+        after_agent_callback=finish_research,
+        before_model_callback=strip_display_line_breaks,
+        after_model_callback=add_display_line_breaks
+    )
+
+
+# Grounded research usually finishes well within a minute; past that it is
+# waiting on a slow search, and the debate goes ahead without it
+_RESEARCH_TIMEOUT_SECONDS = 60.0
+_RESEARCH_TIMEOUT_TEXT = "No research findings (the research step timed out)."
+
+
+@cache
+def _research_stage():
+    """Runs the researcher under a time limit."""
+    from .custom_agents import DeadlineAgent
+
+    # On timeout the debaters and judge get a placeholder instead of the
+    # findings. dual_research_findings is left empty, so neither the research
+    # cache nor the debate cache keeps a debate argued without research.
+    return DeadlineAgent(
+        name="ResearchStage",
+        description="Runs the dual-stance research with a time limit.",
+        sub_agents=[_dual_stance_researcher()],
+        timeout_seconds=_RESEARCH_TIMEOUT_SECONDS,
+        fallback_state={
+            "dual_research_findings": "",
+            "proponent_research_findings": _RESEARCH_TIMEOUT_TEXT,
+            "opponent_research_findings": _RESEARCH_TIMEOUT_TEXT,
+            "proponent_research_brief": _RESEARCH_TIMEOUT_TEXT,
+            "opponent_research_brief": _RESEARCH_TIMEOUT_TEXT,
+        },
+        timeout_message="Research is taking too long, so the debate will continue without it."
+    )
+
+
+# --- 3. INDIVIDUAL DEBATER AGENTS FOR LOOP ITERATION ---
+# Either debater ends the debate by finishing its reply with the
+# [[END_DEBATE]] marker instead of calling a tool, so the debaters carry no
+# tool declarations and ending costs no extra tool-call round trip. Instead of
+# an output_key, each turn is appended to state["debate_history"] (and the
+# state["debate_rounds"] transcript) by the record_debate_round callback, so
+# earlier rounds are kept rather than overwritten. Their instructions carry
+# all the context they need, so the conversation history is not sent.
+@cache
+def _proponent_debater():
+    """Makes the pro argument for one loop round."""
+    from google.adk.agents import LlmAgent
+
+    from .callbacks import (
+        process_debater_response,
+        record_debate_round,
+        strip_display_line_breaks,
+    )
+
+    return LlmAgent(
+        name="ProponentDebater",
+        model=_pick_model("ProponentDebater"),
+        instruction=PROPONENT_DEBATER_INSTRUCTION,
+        description="Makes individual pro arguments in the iterative debate.",
+        include_contents="none",
+        after_agent_callback=record_debate_round,
+        before_model_callback=strip_display_line_breaks,
+        after_model_callback=process_debater_response
+    )
+
+
+@cache
+def _opponent_debater():
+    """Makes the opposing argument for one loop round."""
+    from google.adk.agents import LlmAgent
+
+    from .callbacks import (
+        process_debater_response,
+        record_debate_round,
+        strip_display_line_breaks,
+    )
+
+    return LlmAgent(
+        name="OpponentDebater",
+        model=_pick_model("OpponentDebater"),
+        instruction=OPPONENT_DEBATER_INSTRUCTION,
+        description="Makes individual opposing arguments in the iterative debate.",
+        include_contents="none",
+        after_agent_callback=record_debate_round,
+        before_model_callback=strip_display_line_breaks,
+        after_model_callback=process_debater_response
+    )
+
+
+@cache
+def _redundancy_monitor():
+    """Escalates without a model call once both sides repeat their last argument."""
+    from .custom_agents import RedundancyMonitor
+
+    return RedundancyMonitor(
+        name="RedundancyMonitor",
+        description="Ends the debate loop when both debaters stop adding new arguments.",
+        debater_names=[_proponent_debater().name, _opponent_debater().name]
+    )
+
+
+# --- 4. LOOP AGENT FOR ITERATIVE DEBATE ROUNDS ---
+@cache
+def _iterative_debate_loop():
+    """Alternates the debaters until the debate is over."""
+    from google.adk.agents import LoopAgent
+
+    # Proponent speaks first; stops at max_iterations, when a debater ends
+    # its reply with [[END_DEBATE]], or when the redundancy monitor finds the arguments repeating
+    # or no longer adding much. Six rounds are enough for each side to answer
+    # the other several times; later rounds were mostly restatement.
+    return LoopAgent(
+        name="IterativeDebateLoop",
+        description="Conducts real iterative debate rounds between Proponent and Opponent agents.",
+        sub_agents=[_proponent_debater(), _opponent_debater(), _redundancy_monitor()],
+        max_iterations=6
+    )
+
+
+# --- 5. DEBATE JUDGE ---
+@cache
+def _debate_judge():
+    """Analyzes the debate, declares the winner and invites the next topic."""
+    from google.adk.agents import LlmAgent
+
+    from .callbacks import (
+        add_display_line_breaks,
+        finish_debate,
+        strip_display_line_breaks,
+    )
+
+    # One call writes both the strategic analysis and the final verdict. The
+    # after-agent callback splits the response at the judgment heading into
+    # debate_analysis and final_debate_summary, then posts the greeter's
+    # "another topic?" follow-up itself. The judge has no tools, so ending the
+    # debate costs no extra tool-call round trip; the user's next message goes
+    # back to the greeter because the workflow's agents are not transfer
+    # targets for the runner. Its CONTEXT block already holds the roles, both
+    # sides' research and the whole transcript, so the conversation history
+    # (which repeats all of that) is not sent as well.
+    return LlmAgent(
+        name="DebateJudge",
+        model=_pick_model("DebateJudge"),
+        instruction=DEBATE_JUDGE_INSTRUCTION,
+        description="Analyzes debate strategy and argument strength, then declares the winner with decisive conclusions.",
+        include_contents="none",
+        after_agent_callback=finish_debate,
+        before_model_callback=strip_display_line_breaks,
+        after_model_callback=add_display_line_breaks
+    )
+
+
+# --- 6. SEQUENTIAL DEBATE WORKFLOW ---
+@cache
+def _debate_workflow():
+    """Runs the whole debate pipeline in order."""
+    from google.adk.agents import SequentialAgent
+
+    from .cache import store_debate
+    from .callbacks import start_debate
+
+    return SequentialAgent(
+        name=_WORKFLOW,
+        description="Executes the complete iterative debate process using LoopAgent for real debate rounds.",
+        # Each debate starts with an empty history; a topic that was already
+        # debated is replayed from the debate cache without any model calls
+        before_agent_callback=start_debate,
+        after_agent_callback=store_debate,
+        sub_agents=[
+            _role_assignment_agent(),
+            _research_stage(),
+            _iterative_debate_loop(),
+            _debate_judge()
+        ]
+    )
+
+
+# --- 7. GREETER (ROOT AGENT) ---
+@cache
+def build_root_agent():
+    """
+    Builds the complete agent graph and returns the root (greeter) agent.
+
+    The graph is built once; later calls return the same agent, which is
+    also what the module's root_agent attribute resolves to.
+
+    Returns:
+        LlmAgent: The DebateTeamGreeter agent with the full workflow attached
+    """
+    from google.adk.agents import LlmAgent
+
+    from .callbacks import prefilter_debate_topic
+
+    # Entry point users talk to; transfers to the workflow via
+    # start_debate_workflow. Plain "debate X" messages are recognized by the
+    # before-model callback, which makes that call without asking the model.
+    return LlmAgent(
+        name=_GREETER,
+        model=_pick_model(_GREETER),
+        tools=[get_start_workflow_tool()],
+        before_model_callback=prefilter_debate_topic,
+        instruction=GREETER_INSTRUCTION,
+        description="Greets users, introduces the iterative debate process, transfers to workflow, and handles follow-ups.",
+        sub_agents=[_debate_workflow()]
+    )
@@ -0,0 +1,189 @@
+# =============================================================================
+# AI DEBATE TEAM - Response Caches
+# =============================================================================
+# Process-local caches that let agents skip a Gemini round trip when they have
+# already produced an answer for the same input. Each cache is exposed as a
+# before/after_agent_callback pair so agent.py can attach it to an agent:
+#   - before_agent_callback: on a hit, writes the cached output to state and
+#     returns it as Content, which makes ADK skip the agent's model call
+#   - after_agent_callback: on a miss, stores what the agent just wrote
+# The caches live in this process only; every Agent Engine replica warms its
+# own copy.
+# =============================================================================
+
+import re
+from collections import OrderedDict
+
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+
+# Upper bound on remembered topics; the least recently used entry is dropped
+_ROLE_CACHE_SIZE = 256
+_role_assignments_cache = OrderedDict()
+
+
+def normalize_topic(topic):
+    """Returns the cache key for a topic: lowercased with whitespace collapsed."""
+    return " ".join(str(topic).lower().split())
+
+
+# --- ROLE ASSIGNMENT CACHE ---
+# RoleAssignmentAgent only depends on the topic, so repeat topics
+# ("nuclear power", "Nuclear  Power") reuse the first answer: both the
+# rendered role_assignments and the parsed debate_roles fields.
+def use_cached_role_assignments(callback_context: CallbackContext):
+    """Serves role_assignments from the cache when this topic was seen before."""
+    topic = callback_context.state.get("debate_topic")
+    if not topic:
+        return None
+    key = normalize_topic(topic)
+    cached = _role_assignments_cache.get(key)
+    if cached is None:
+        return None
+    _role_assignments_cache.move_to_end(key)
+    output, roles = cached
+    callback_context.state["role_assignments"] = output
+    callback_context.state["debate_roles"] = roles
+    return types.Content(role="model", parts=[types.Part(text=output)])
+
+
+def store_role_assignments(callback_context: CallbackContext):
+    """Remembers the role_assignments the agent produced for this topic."""
+    state = callback_context.state
+    topic = state.get("debate_topic")
+    output = state.get("role_assignments")
+    if topic and output:
+        key = normalize_topic(topic)
+        _role_assignments_cache[key] = (output, state.get("debate_roles"))
+        _role_assignments_cache.move_to_end(key)
+        if len(_role_assignments_cache) > _ROLE_CACHE_SIZE:
+            _role_assignments_cache.popitem(last=False)
+    return None
+
+
+# --- RESEARCH PLAN CACHE ---
+# DualStanceResearcher is the slowest step (search-grounded generation), and
+# its output is determined by the role assignments rather than by the exact
+# topic wording. Research is therefore remembered by the keyword set of the
+# role assignments (the parsed debate_roles fields, or the rendered text if
+# the model's JSON could not be parsed) and reused when a new set overlaps an
+# old one by at least _RESEARCH_MATCH_THRESHOLD (Jaccard), e.g. "nuclear
+# power" vs "nuclear energy".
+_RESEARCH_CACHE_SIZE = 64
+_RESEARCH_MATCH_THRESHOLD = 0.6
+_research_cache = OrderedDict()
+# State keys the researcher (and its splitting callback) writes
+_RESEARCH_KEYS = (
+    "dual_research_findings",
+    "proponent_research_findings",
+    "opponent_research_findings",
+    "proponent_research_brief",
+    "opponent_research_brief",
+)
+_KEYWORD = re.compile(r"[a-z]{4,}")
+# Words every role assignment tends to contain; counting them would make
+# unrelated topics look alike
+_IGNORED_WORDS = frozenset((
+    "debate", "topic", "question", "proponent", "opponent", "position",
+    "main", "argument", "arguments", "setup", "they", "their", "that",
+    "this", "with", "should", "would", "against", "from", "into", "more",
+    "than", "what", "which", "will", "have", "been", "about",
+))
+
+
+def _role_keywords(state):
+    """Returns the content words of the role assignments in state."""
+    roles = state.get("debate_roles")
+    text = " ".join(roles.values()) if roles else state.get("role_assignments") or ""
+    return frozenset(_KEYWORD.findall(text.lower())) - _IGNORED_WORDS
+
+
+def _jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def use_cached_research(callback_context: CallbackContext):
+    """Serves the research of an earlier debate whose roles closely match."""
+    keywords = _role_keywords(callback_context.state)
+    if not keywords:
+        return None
+    best_key, best_score = None, _RESEARCH_MATCH_THRESHOLD
+    for key in _research_cache:
+        score = _jaccard(keywords, key)
+        if score >= best_score:
+            best_key, best_score = key, score
+    if best_key is None:
+        return None
+    _research_cache.move_to_end(best_key)
+    cached = _research_cache[best_key]
+    for state_key, value in zip(_RESEARCH_KEYS, cached):
+        callback_context.state[state_key] = value
+    return types.Content(role="model", parts=[types.Part(text=cached[0])])
+
+
+def store_research(callback_context: CallbackContext):
+    """Remembers the research produced for these role assignments."""
+    state = callback_context.state
+    key = _role_keywords(state)
+    results = tuple(state.get(state_key) or "" for state_key in _RESEARCH_KEYS)
+    if key and results[0]:
+        _research_cache[key] = results
+        _research_cache.move_to_end(key)
+        if len(_research_cache) > _RESEARCH_CACHE_SIZE:
+            _research_cache.popitem(last=False)
+    return None
+
+
+# --- DEBATE RESULT CACHE ---
+# The topic is the only real input to AIDebateWorkflow, so a finished debate
+# is remembered by topic and replayed as a whole when the same topic comes
+# back. A hit skips every model call in the workflow (roles, research, all
+# debate rounds and the judge). Every state key the workflow writes is stored
+# and restored, so after a replay the session state matches the replayed
+# debate rather than whatever topic was debated before it. Fewer entries are
+# kept than for roles because each one holds a full transcript.
+_DEBATE_CACHE_SIZE = 64
+_debate_cache = OrderedDict()
+# State keys a finished debate leaves behind
+_DEBATE_STATE_KEYS = (
+    "role_assignments",
+    "debate_roles",
+) + _RESEARCH_KEYS + (
+    "debate_history",
+    "debate_rounds",
+    "debate_analysis",
+    "final_debate_summary",
+)
+# The part of a cached debate that is shown again, in display order
+_DEBATE_DISPLAY_KEYS = ("debate_rounds", "debate_analysis", "final_debate_summary")
+
+
+def use_cached_debate(callback_context: CallbackContext):
+    """Replays the transcript and verdict when this topic was debated before."""
+    topic = callback_context.state.get("debate_topic")
+    if not topic:
+        return None
+    key = normalize_topic(topic)
+    cached = _debate_cache.get(key)
+    if cached is None:
+        return None
+    _debate_cache.move_to_end(key)
+    for state_key, value in cached.items():
+        callback_context.state[state_key] = value
+    text = "\n\n".join(cached[state_key] or "" for state_key in _DEBATE_DISPLAY_KEYS)
+    return types.Content(role="model", parts=[types.Part(text=text)])
+
+
+def store_debate(callback_context: CallbackContext):
+    """Remembers the state of the debate that just finished."""
+    state = callback_context.state
+    topic = state.get("debate_topic")
+    # A debate argued without research (the research step timed out) is not
+    # worth replaying
+    if topic and state.get("final_debate_summary") and state.get("dual_research_findings"):
+        key = normalize_topic(topic)
+        _debate_cache[key] = {state_key: state.get(state_key) for state_key in _DEBATE_STATE_KEYS}
+        _debate_cache.move_to_end(key)
+        if len(_debate_cache) > _DEBATE_CACHE_SIZE:
+            _debate_cache.popitem(last=False)
+    return None
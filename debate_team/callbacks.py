@@ -0,0 +1,373 @@
+# =============================================================================
+# AI DEBATE TEAM - Agent Callbacks
+# =============================================================================
+# Plain module-level functions that agent.py attaches to agents as ADK
+# before/after callbacks. They live at module scope (never as lambdas or
+# closures) so the agent graph can be pickled for Agent Engine deployment.
+# This module is only imported by the agent factories in agent.py.
+# =============================================================================
+
+import re
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+from pydantic import BaseModel, ValidationError
+
+
+# --- TURN TEXT ---
+# The debaters and the judge have no output_key (ADK would only keep the last
+# response of a turn), so their text is read back from the session events.
+def _current_turn_text(callback_context: CallbackContext):
+    """Returns the text of this agent's most recent turn in this invocation."""
+    ctx = callback_context._invocation_context
+    name = callback_context.agent_name
+    turn = []
+    in_turn = False
+    # Walk back to this agent's latest run of events (its model responses and
+    # tool results), skipping anything later agents (e.g. a transfer target)
+    # wrote after it, and stop at the first event from someone else before it.
+    for event in reversed(ctx.session.events):
+        if event.invocation_id != ctx.invocation_id:
+            break
+        if event.author != name:
+            if in_turn:
+                break
+            continue
+        in_turn = True
+        if not event.partial and event.content and event.content.parts:
+            turn.append("".join(part.text or "" for part in event.content.parts))
+    return "".join(reversed(turn))
+
+
+# --- ROLE ASSIGNMENTS ---
+# RoleAssignmentAgent answers with a RoleAssignments JSON object. The parsed
+# fields are kept in state["debate_roles"] for Python code (e.g. the research
+# cache), and the reply is rewritten into the DEBATE SETUP markdown below, so
+# the chat and the {role_assignments} template input look as they always did.
+class RoleAssignments(BaseModel):
+    """The two positions RoleAssignmentAgent defines for a debate."""
+
+    topic: str
+    debate_question: str
+    proponent_position: str
+    proponent_main_argument: str
+    opponent_position: str
+    opponent_main_argument: str
+
+
+_ROLE_LAYOUT = """## 📋 **DEBATE SETUP**
+
+**Debate Topic:** {topic}
+**Debate Question:** {debate_question}
+
+**Proponent Position:** {proponent_position}
+**Proponent Main Argument:** {proponent_main_argument}
+
+**Opponent Position:** {opponent_position}
+**Opponent Main Argument:** {opponent_main_argument}"""
+
+
+def request_role_json(callback_context: CallbackContext, llm_request: LlmRequest):
+    """Asks the model for a RoleAssignments JSON object."""
+    llm_request.set_output_schema(RoleAssignments)
+    return None
+
+
+def render_role_assignments(callback_context: CallbackContext, llm_response: LlmResponse):
+    """Stores the parsed roles and replaces the JSON reply with its markdown layout."""
+    content = llm_response.content
+    if not content or not content.parts:
+        return None
+    # Streamed chunks are incomplete JSON; show nothing until the full reply
+    if llm_response.partial:
+        for part in content.parts:
+            part.text = None
+        return llm_response
+    text = "".join(part.text or "" for part in content.parts if not part.thought)
+    try:
+        roles = RoleAssignments.model_validate_json(text)
+    except ValidationError:
+        # Leave an unparseable reply as it is rather than lose it, and drop
+        # the fields of any earlier debate in this session
+        callback_context.state["debate_roles"] = None
+        return add_display_line_breaks(callback_context, llm_response)
+    callback_context.state["debate_roles"] = roles.model_dump()
+    llm_response.content = types.Content(
+        role=content.role,
+        parts=[types.Part(text=_ROLE_LAYOUT.format(**roles.model_dump()))],
+    )
+    return add_display_line_breaks(callback_context, llm_response) or llm_response
+
+
+# --- RESEARCH SPLITTING ---
+# The DualStanceResearcher writes both stances into one response under
+# "dual_research_findings". Everything from the opponent heading onward is the
+# opponent's research; everything before it is the proponent's.
+# Each debater reads its own side's research in full but the other side's only
+# as a brief: its first few bullet points, without the source list.
+_OPPONENT_HEADING = re.compile(r"^[^\n]*OPPONENT RESEARCH FINDINGS", re.MULTILINE)
+_SOURCES_HEADING = re.compile(r"^[^\n]*Key Reference Articles", re.MULTILINE)
+_BULLET = re.compile(r"^[ \t]*(?:[-*•]|\d+[.)])[ \t]+(.+)$", re.MULTILINE)
+_BRIEF_POINTS = 3
+# Used when the section has no bullets at all
+_BRIEF_FALLBACK_CHARS = 600
+
+
+def research_brief(section):
+    """Returns the first few points of one side's research, without sources."""
+    match = _SOURCES_HEADING.search(section)
+    body = (section[:match.start()] if match else section).replace("<br>", "")
+    points = _BULLET.findall(body)[:_BRIEF_POINTS]
+    if points:
+        return "\n".join(f"- {point.strip()}" for point in points)
+    return body.strip()[:_BRIEF_FALLBACK_CHARS]
+
+
+def split_research_findings(callback_context: CallbackContext):
+    """Copies each stance's section of the combined research into its own state key."""
+    state = callback_context.state
+    text = state.get("dual_research_findings") or ""
+    match = _OPPONENT_HEADING.search(text)
+    if match is None:
+        # The model ignored the layout; give both debaters the full text
+        proponent = opponent = text
+    else:
+        proponent = text[:match.start()].rstrip()
+        opponent = text[match.start():]
+    # Downstream instructions still read these two keys, so they are unchanged
+    state["proponent_research_findings"] = proponent
+    state["opponent_research_findings"] = opponent
+    state["proponent_research_brief"] = research_brief(proponent)
+    state["opponent_research_brief"] = research_brief(opponent)
+    return None
+
+
+def finish_research(callback_context: CallbackContext):
+    """Splits the combined research and stores it in the research cache."""
+    from .cache import store_research
+
+    split_research_findings(callback_context)
+    return store_research(callback_context)
+
+
+# --- JUDGE SPLITTING ---
+# The DebateJudge writes its analysis and then its verdict in one response.
+# The analysis goes to "debate_analysis" and the verdict (from the judgment
+# heading onward) to "final_debate_summary", the keys the old two-agent
+# pipeline produced.
+_JUDGMENT_HEADING = re.compile(r"^[^\n]*FINAL DEBATE JUDGMENT", re.MULTILINE)
+
+
+def split_debate_evaluation(callback_context: CallbackContext):
+    """Copies the judge's analysis and verdict into their own state keys."""
+    state = callback_context.state
+    text = _current_turn_text(callback_context)
+    match = _JUDGMENT_HEADING.search(text)
+    if match is None:
+        analysis = summary = text
+    else:
+        analysis = text[:match.start()].rstrip()
+        summary = text[match.start():]
+    state["debate_analysis"] = analysis
+    state["final_debate_summary"] = summary
+    return None
+
+
+# --- END OF DEBATE ---
+# Replaces the judge's old return_to_greeter tool call: the follow-up the
+# greeter would have given is posted directly, without another model call.
+_NEXT_TOPIC_PROMPT = (
+    "Thank you for joining this iterative debate! Would you like to explore "
+    "another topic? I'm ready for the next iterative debate!"
+)
+
+
+def finish_debate(callback_context: CallbackContext):
+    """Stores the judge's analysis and verdict, then invites the next topic."""
+    split_debate_evaluation(callback_context)
+    return types.Content(role="model", parts=[types.Part(text=_NEXT_TOPIC_PROMPT)])
+
+
+# --- GREETER TOPIC PREFILTER ---
+# Messages that explicitly ask for a debate ("debate nuclear power", "let's
+# debate X") are answered by the greeter without a model call: the topic is
+# pulled out with a regex and the usual start_debate_workflow call is returned
+# as if the model had made it, so ADK runs the tool and transfers to the
+# workflow exactly as before. Anything else (greetings, questions such as
+# "should we stop?", vaguer requests) still goes to the model, which handles
+# the general case.
+_TOPIC_REQUEST = re.compile(
+    r"^(?:(?:let'?s|let us|i want to|i'd like to|can we|please)\s+)?debate\s+"
+    r"(?:about\s+|on\s+)?(?P<topic>.+?)[\s?.!]*$",
+    re.IGNORECASE,
+)
+# Follow-ups like "let's debate again" name no topic; the model asks for one
+_VAGUE_TOPICS = frozenset((
+    "again", "another", "another one", "another topic", "more", "something",
+    "something else", "it", "this", "that",
+))
+# "debate me", "debate is fun", "debate team, ...": the word after "debate"
+# is an object, verb or the team's own name rather than the start of a topic
+_NOT_A_TOPIC_START = re.compile(
+    r"^(?:me|you|him|her|them|with|against|team|club|is|are|was|were|"
+    r"can|could|will|would|should|does|do|sounds?|seems?)\b",
+    re.IGNORECASE,
+)
+# A comma followed by a question ("..., right?", "..., what can you do")
+# means the message goes on to ask something else
+_CLAUSE_BREAK = re.compile(
+    r",(?:.*\?|\s*(?:right|what|how|why|who|which|can|could|do|does|is|are)\b)",
+    re.IGNORECASE,
+)
+# Longer messages are probably not a bare topic; let the model read them
+_MAX_TOPIC_LENGTH = 120
+
+
+def extract_debate_topic(text):
+    """Returns the topic of a plain debate request, or None."""
+    match = _TOPIC_REQUEST.match(text.strip())
+    if match is None:
+        return None
+    topic = match.group("topic").strip(" \"'")
+    if not topic or len(topic) > _MAX_TOPIC_LENGTH or topic.lower() in _VAGUE_TOPICS:
+        return None
+    if _NOT_A_TOPIC_START.match(topic) or _CLAUSE_BREAK.search(text):
+        return None
+    return topic
+
+
+def prefilter_debate_topic(callback_context: CallbackContext, llm_request: LlmRequest):
+    """Starts the workflow without a model call when the topic is obvious."""
+    # Only a fresh user message qualifies, not a tool result or another turn
+    last = llm_request.contents[-1] if llm_request.contents else None
+    if last is None or last.role != "user" or not last.parts:
+        return None
+    text = "".join(part.text or "" for part in last.parts)
+    topic = extract_debate_topic(text) if text else None
+    if topic is None:
+        return None
+    return LlmResponse(content=types.Content(role="model", parts=[
+        types.Part(text=f"Excellent! Let's conduct an iterative debate on: {topic}"),
+        # Must match the tool function's name in agent.py
+        types.Part(function_call=types.FunctionCall(
+            name="start_debate_workflow", args={"topic": topic}
+        )),
+    ]))
+
+
+# --- DISPLAY LINE BREAKS ---
+# The instructions no longer ask the model to type <br> tags (they cost prompt
+# tokens on every call). The chat UI still needs them for spacing, so they are
+# added to the model's text here instead: a blank line becomes <br><br> and a
+# single newline becomes <br>. The newlines themselves are kept so headings and
+# lists still parse as markdown.
+_PARAGRAPH_BREAK = re.compile(r"\n{2,}")
+
+
+def add_display_line_breaks(callback_context: CallbackContext, llm_response: LlmResponse):
+    """Adds <br> display breaks to the text parts of a model response."""
+    content = llm_response.content
+    if not content or not content.parts:
+        return None
+    changed = False
+    for part in content.parts:
+        if part.text and "\n" in part.text and not part.thought:
+            paragraphs = _PARAGRAPH_BREAK.split(part.text)
+            part.text = "<br><br>\n\n".join(p.replace("\n", "<br>\n") for p in paragraphs)
+            changed = True
+    return llm_response if changed else None
+
+
+# The <br> tags end up in state as well (output_key and the callbacks below
+# store the displayed text), so every {placeholder} filled from state would
+# carry them into the next prompt. Agents that read earlier output get this
+# before_model_callback, which drops the tags from the rendered instruction;
+# the newlines next to them stay, so the text reads the same to the model.
+def strip_display_line_breaks(callback_context: CallbackContext, llm_request: LlmRequest):
+    """Removes <br> display tags from the request's system instruction."""
+    config = llm_request.config
+    if config and isinstance(config.system_instruction, str):
+        config.system_instruction = config.system_instruction.replace("<br>", "")
+    return None
+
+
+# --- END OF DEBATE MARKER ---
+# A debater ends the debate by finishing its reply with _END_DEBATE_MARKER
+# rather than calling a tool. The marker is removed before the reply is shown
+# and recorded in state["end_debate_requested"]. record_debate_round then
+# escalates after saving the turn, so the closing argument still reaches the
+# history. (Escalating on the model response itself would make the LoopAgent
+# stop before the after-agent callback runs.)
+_END_DEBATE_MARKER = "[[END_DEBATE]]"
+
+
+def process_debater_response(callback_context: CallbackContext, llm_response: LlmResponse):
+    """Handles the end-of-debate marker, then adds the display line breaks."""
+    content = llm_response.content
+    found = False
+    for part in (content.parts if content else None) or ():
+        if part.text and _END_DEBATE_MARKER in part.text and not part.thought:
+            part.text = part.text.replace(_END_DEBATE_MARKER, "").rstrip()
+            found = True
+    if found:
+        callback_context.state["end_debate_requested"] = True
+    # ADK uses the first non-None result, so both steps share one callback
+    return add_display_line_breaks(callback_context, llm_response) or (
+        llm_response if found else None
+    )
+
+
+# --- DEBATE HISTORY ---
+# Every debater turn is appended to state["debate_history"] as
+# {"speaker": agent name, "text": argument}. ADK records a state change only
+# when a key is assigned, so the list is copied, extended and assigned back
+# (it holds at most two entries per loop iteration). The list is also rendered
+# into state["debate_rounds"], the numbered transcript the debaters and the
+# judge read, in plain Python rather than by a model call.
+_NO_ROUNDS_YET = "(No rounds yet.)"
+
+
+def format_debate_rounds(history):
+    """Renders the debate history as a markdown transcript numbered by round."""
+    lines = []
+    round_number = 0
+    for entry in history:
+        # A round starts each time the opening debater speaks
+        if entry.get("speaker") == history[0].get("speaker"):
+            round_number += 1
+            lines.append(f"### Round {round_number}")
+        lines.append((entry.get("text") or "").strip())
+    return "\n\n".join(lines) or _NO_ROUNDS_YET
+
+
+def reset_debate_history(callback_context: CallbackContext):
+    """Starts an empty debate history for a new debate."""
+    callback_context.state["debate_history"] = []
+    callback_context.state["debate_rounds"] = _NO_ROUNDS_YET
+    return None
+
+
+def start_debate(callback_context: CallbackContext):
+    """Resets the history, or replays the cached debate for a repeat topic."""
+    from .cache import use_cached_debate
+
+    reset_debate_history(callback_context)
+    return use_cached_debate(callback_context)
+
+
+def record_debate_round(callback_context: CallbackContext):
+    """Appends this debater's latest argument and ends the loop when asked to."""
+    state = callback_context.state
+    text = _current_turn_text(callback_context)
+    if text.strip():
+        history = list(state.get("debate_history") or ())
+        history.append({"speaker": callback_context.agent_name, "text": text})
+        state["debate_history"] = history
+        state["debate_rounds"] = format_debate_rounds(history)
+    if state.get("end_debate_requested"):
+        state["end_debate_requested"] = False
+        # The state change above makes ADK emit an event for this callback,
+        # and it carries these actions, so the LoopAgent sees the escalation
+        callback_context._event_actions.escalate = True
+    return None
@@ -0,0 +1,167 @@
+# =============================================================================
+# AI DEBATE TEAM - Custom (non-LLM) Agents
+# =============================================================================
+# BaseAgent subclasses that run plain Python inside the workflow instead of
+# calling Gemini. They take no model round trip of their own, so they are
+# cheap enough to run on every loop iteration. Only the agent factories in
+# agent.py import this module.
+# =============================================================================
+
+import asyncio
+import math
+import re
+from collections import Counter
+from typing import AsyncGenerator, Dict, List
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+
+def lexical_similarity(a, b):
+    """Cosine similarity (0.0-1.0) between the word counts of two texts."""
+    va = Counter(_WORD.findall(a.lower()))
+    vb = Counter(_WORD.findall(b.lower()))
+    if not va or not vb:
+        return 0.0
+    dot = sum(count * vb[word] for word, count in va.items())
+    norm = math.sqrt(sum(c * c for c in va.values())) * math.sqrt(sum(c * c for c in vb.values()))
+    return dot / norm
+
+
+# --- REDUNDANCY MONITOR ---
+# Runs after both debaters inside IterativeDebateLoop and reads their turns from
+# state["debate_history"]. When every debater's latest argument is nearly the
+# same as their previous one, the debate has stopped adding information, so the
+# monitor escalates and the LoopAgent exits without spending more rounds. It
+# also escalates once min_rounds have been argued if the average novelty of the
+# later turns (1 - similarity to the same debater's previous turn) is below
+# min_novelty, which catches debates that drift slowly instead of repeating
+# outright. This backs up the debaters' own [[END_DEBATE]] marker, which
+# depends on the model noticing the repetition itself.
+class RedundancyMonitor(BaseAgent):
+    """Ends the debate loop once every debater starts repeating themselves."""
+
+    # Agent names whose turns are compared
+    debater_names: List[str]
+    # Word-count cosine at or above which two arguments count as a repeat
+    threshold: float = 0.8
+    # Rounds after which low average novelty alone ends the debate
+    min_rounds: int = 3
+    # Average novelty below which a debate of min_rounds or more is finished
+    min_novelty: float = 0.25
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        # The debate history is kept by callbacks.record_debate_round
+        turns = {name: [] for name in self.debater_names}
+        for entry in ctx.session.state.get("debate_history") or ():
+            if entry.get("speaker") in turns:
+                # Without the <br> display tags, which would count as a
+                # shared word in every turn
+                turns[entry["speaker"]].append((entry.get("text") or "").replace("<br>", ""))
+
+        # Similarity of every turn to the same debater's previous turn
+        similarities = {
+            name: [lexical_similarity(b, a) for a, b in zip(texts, texts[1:])]
+            for name, texts in turns.items()
+        }
+        repeating = all(
+            scores and scores[-1] >= self.threshold for scores in similarities.values()
+        )
+        scores = [score for values in similarities.values() for score in values]
+        rounds = min(len(texts) for texts in turns.values())
+        stale = (
+            rounds >= self.min_rounds
+            and 1.0 - sum(scores) / len(scores) < self.min_novelty
+        )
+        if repeating or stale:
+            yield Event(
+                author=self.name,
+                invocation_id=ctx.invocation_id,
+                branch=ctx.branch,
+                actions=EventActions(escalate=True),
+            )
+
+
+# --- DEADLINE AGENT ---
+# Runs its single sub-agent but gives up once timeout_seconds have passed,
+# so one slow step (typically a search-grounded research call stuck on a slow
+# search) cannot hold up the whole debate. On timeout the sub-agent is
+# cancelled and fallback_state is written instead of its output, which lets
+# the following agents run with a placeholder for the missing research.
+#
+# The sub-agent runs in its own task and hands each event over through a
+# queue, waiting until the event has been yielded (and so recorded in the
+# session by the runner) before it continues. That keeps its state reads in
+# step with its own earlier events, exactly as when it runs directly.
+class DeadlineAgent(BaseAgent):
+    """Runs one sub-agent with a time limit and writes fallback state on timeout."""
+
+    # Seconds the sub-agent may run in total
+    timeout_seconds: float
+    # State written when the sub-agent does not finish in time
+    fallback_state: Dict[str, str]
+    # Message shown to the user when the sub-agent does not finish in time
+    timeout_message: str = ""
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout_seconds
+        handoff = asyncio.Queue()
+
+        async def pump():
+            events = self.sub_agents[0].run_async(ctx)
+            try:
+                async for event in events:
+                    consumed = loop.create_future()
+                    handoff.put_nowait((event, consumed))
+                    await consumed
+            finally:
+                # Close the sub-agent inside this task; left to the garbage
+                # collector, its tracing spans would end in another context
+                await events.aclose()
+                handoff.put_nowait((None, None))
+
+        task = asyncio.ensure_future(pump())
+        try:
+            while True:
+                try:
+                    event, consumed = await asyncio.wait_for(
+                        handoff.get(), max(deadline - loop.time(), 0.0)
+                    )
+                except asyncio.TimeoutError:
+                    break
+                if event is None:
+                    # Finished in time; re-raises the sub-agent's error, if any
+                    await task
+                    return
+                yield event
+                consumed.set_result(None)
+        finally:
+            task.cancel()
+
+        # Timed out: make sure the sub-agent has stopped before writing
+        # fallback state over whatever it was doing
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        content = None
+        if self.timeout_message:
+            content = types.Content(
+                role="model", parts=[types.Part(text=self.timeout_message)]
+            )
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            branch=ctx.branch,
+            content=content,
+            actions=EventActions(state_delta=dict(self.fallback_state)),
+        )
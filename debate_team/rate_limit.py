@@ -0,0 +1,165 @@
+# =============================================================================
+# AI DEBATE TEAM - Gemini Rate Limiting
+# =============================================================================
+# A Gemini model wrapper that paces requests to the project's quota and
+# retries the calls that still get rejected with 429/503. agent.py hands the
+# same wrapper instance to every agent (see _model), so one process-wide
+# budget covers all of them.
+#
+# Environment:
+#   DEBATE_TEAM_GEMINI_RPM: requests per minute to allow (unset = no pacing)
+#   DEBATE_TEAM_GEMINI_TPM: estimated input tokens per minute (unset = no pacing)
+# =============================================================================
+
+import asyncio
+import os
+import random
+import threading
+import time
+import weakref
+from typing import AsyncGenerator
+
+from google.adk.models import Gemini, LlmRequest, LlmResponse
+from google.genai import Client, errors, types
+
+# Status codes worth retrying: quota exhausted and model overloaded
+_RETRYABLE_CODES = (429, 503)
+_MAX_ATTEMPTS = 4
+_BASE_DELAY_SECONDS = 1.0
+
+
+class _TokenBucket:
+    """Per-minute budget shared by every event loop and thread in the process."""
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        # A threading lock (not asyncio.Lock) so the bucket is not tied to the
+        # event loop that happened to touch it first
+        self._lock = threading.Lock()
+
+    def _reserve(self, amount):
+        """Takes amount from the bucket and returns how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # The balance may go negative: callers queue behind each other
+            self.tokens -= amount
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    async def acquire(self, amount=1.0):
+        delay = self._reserve(min(amount, self.capacity))
+        if delay:
+            await asyncio.sleep(delay)
+
+
+def _bucket_from_env(name):
+    value = os.environ.get(name)
+    return _TokenBucket(float(value)) if value else None
+
+
+_REQUEST_BUCKET = _bucket_from_env("DEBATE_TEAM_GEMINI_RPM")
+_TOKEN_BUCKET = _bucket_from_env("DEBATE_TEAM_GEMINI_TPM")
+
+
+def _estimate_tokens(llm_request):
+    """Rough input size (about 4 characters per token) used for TPM pacing."""
+    chars = len(str(llm_request.config.system_instruction or "")) if llm_request.config else 0
+    for content in llm_request.contents:
+        for part in content.parts or ():
+            chars += len(part.text or "")
+    return chars // 4
+
+
+# --- PER-EVENT-LOOP CLIENTS ---
+# google-genai keeps one async HTTP connection pool per Client, and those
+# connections belong to the event loop that opened them. Gemini caches a
+# single Client on the instance, which breaks as soon as the process runs
+# more than one loop: AdkApp (Agent Engine) calls asyncio.run in a fresh
+# thread for every query, so the second query would reuse connections of a
+# loop that is already closed ("Event loop is closed"). Clients are therefore
+# kept per running loop. The aiohttp transport (installed with Agent Engine)
+# holds a strong reference to its loop, so the weak key alone would never
+# expire; each client is also closed and dropped when its loop shuts down.
+_loop_clients = weakref.WeakKeyDictionary()
+_loop_clients_lock = threading.Lock()
+
+
+async def _close_on_loop_shutdown(client):
+    """Async generator that closes client when its event loop shuts down."""
+    try:
+        yield
+    finally:
+        # asyncio.run finalizes a loop's unfinished async generators
+        # (shutdown_asyncgens) while the loop still runs, so the connections
+        # can be closed properly here
+        loop = asyncio.get_running_loop()
+        with _loop_clients_lock:
+            if _loop_clients.get(loop, (None,))[0] is client:
+                del _loop_clients[loop]
+        await client.aio.aclose()
+
+
+def _start(async_generator):
+    """Runs async_generator up to its first yield from synchronous code."""
+    try:
+        async_generator.asend(None).send(None)
+    except StopIteration:
+        pass
+    return async_generator
+
+
+class RateLimitedGemini(Gemini):
+    """Gemini that waits for quota before each call and retries 429/503 responses."""
+
+    @property
+    def api_client(self) -> Client:
+        """Returns the google-genai Client for the running event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None:
+            # No loop to tie connections to (e.g. a synchronous backend check)
+            return self._new_client()
+        with _loop_clients_lock:
+            entry = _loop_clients.get(loop)
+            if entry is None:
+                client = self._new_client()
+                # The guard is stored next to the client: the loop only keeps
+                # a weak reference to its async generators
+                entry = _loop_clients[loop] = (client, _start(_close_on_loop_shutdown(client)))
+        return entry[0]
+
+    def _new_client(self):
+        # ADK's tracking headers are private: a cached property in 1.x and a
+        # plain method in later releases
+        headers = getattr(self, "_tracking_headers", None)
+        if callable(headers):
+            headers = headers()
+        return Client(http_options=types.HttpOptions(headers=headers))
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            if _REQUEST_BUCKET is not None:
+                await _REQUEST_BUCKET.acquire()
+            if _TOKEN_BUCKET is not None:
+                await _TOKEN_BUCKET.acquire(_estimate_tokens(llm_request))
+            yielded = False
+            try:
+                async for response in super().generate_content_async(llm_request, stream):
+                    yielded = True
+                    yield response
+                return
+            except errors.APIError as error:
+                # Once part of a response has been streamed out it cannot be
+                # taken back, so only failures before the first chunk retry
+                if yielded or error.code not in _RETRYABLE_CODES or attempt == _MAX_ATTEMPTS:
+                    raise
+            # Exponential backoff with jitter: ~1s, 2s, 4s
+            await asyncio.sleep(_BASE_DELAY_SECONDS * 2 ** (attempt - 1) * (0.5 + random.random()))
@@ -0,0 +1,33 @@
+# =============================================================================
+# AI DEBATE TEAM - Tool Wrappers
+# =============================================================================
+# FunctionTool subclasses used by the tool getters in agent.py. Like the other
+# helper modules, this one is only imported when the tools are first built.
+# =============================================================================
+
+from typing import Optional
+
+from google.adk.tools import FunctionTool
+from google.genai import types
+
+
+# --- CACHED FUNCTION TOOL ---
+# ADK 1.2.1 rebuilds a FunctionTool's declaration (signature inspection, type
+# hints to JSON schema, pydantic validation) for every model request the tool
+# is attached to. The declaration only depends on the wrapped function and on
+# the API variant (Gemini API or Vertex AI, fixed per process by environment),
+# so it is built once per variant and reused. The cached declaration is shared
+# between requests and must be treated as read-only.
+class CachedFunctionTool(FunctionTool):
+    """FunctionTool that builds its function declaration only once."""
+
+    def __init__(self, func):
+        super().__init__(func)
+        self._declarations = {}
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+        variant = self._api_variant
+        declaration = self._declarations.get(variant)
+        if declaration is None:
+            declaration = self._declarations[variant] = super()._get_declaration()
+        return declaration
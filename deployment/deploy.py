@@ -39,6 +39,10 @@ import os
 # os: Built-in Python module for operating system interface
 # Used here for environment variable access
 
+import sys
+# sys: Built-in Python module for interpreter access
+# Used here to write the agent list straight to stdout
+
 import vertexai
 # vertexai: Google Cloud's AI platform SDK
 # Provides access to AI services like Agent Engines, models, etc.
@@ -52,17 +56,11 @@ from dotenv import load_dotenv
 # dotenv: Third-party library for loading environment variables from .env files
 # This is essential for keeping sensitive data (like project IDs) out of code
 
-from debate_team.agent import root_agent
-# Import our main agent from the local package
-# This is the agent we defined in agent.py that will be deployed
-
-from vertexai import agent_engines
-# agent_engines: Vertex AI service for deploying and managing ADK agents
-# This allows our local agents to run in Google Cloud
-
-from vertexai.preview.reasoning_engines import AdkApp
-# AdkApp: Wrapper that packages our ADK agent for cloud deployment
-# This bridges local ADK agents and cloud Agent Engines
+# The remaining imports live inside the functions that use them:
+# - debate_team.agent.root_agent and AdkApp are only needed by create(), and
+#   importing them loads ADK and builds the whole agent graph
+# - agent_engines is only needed once vertexai.init() has run
+# so --list and --delete start without that cost.
 
 # --- COMMAND-LINE FLAGS SETUP ---
 # absl.flags provides a robust system for command-line argument parsing
@@ -121,6 +119,18 @@ def create() -> None:
         The agent runs in Google's managed environment, not your local machine.
         Users can interact with it through API calls from anywhere.
     """
+    from debate_team.agent import root_agent
+    # Import our main agent from the local package
+    # This is the agent we defined in agent.py that will be deployed
+
+    from vertexai import agent_engines
+    # agent_engines: Vertex AI service for deploying and managing ADK agents
+    # This allows our local agents to run in Google Cloud
+
+    from vertexai.preview.reasoning_engines import AdkApp
+    # AdkApp: Wrapper that packages our ADK agent for cloud deployment
+    # This bridges local ADK agents and cloud Agent Engines
+
     # AdkApp wraps our local agent for cloud deployment
     # enable_tracing=True allows you to see detailed execution logs
     adk_app = AdkApp(agent=root_agent, enable_tracing=True)
@@ -140,7 +150,9 @@ def create() -> None:
         # Python packages that must be installed in the cloud environment
         # These are the dependencies your agent needs to run
         requirements=[
-            "google-adk>=1.1.1",                           # ADK framework
+            # Pinned to uv.lock: tools.py, callbacks.py and rate_limit.py use
+            # private ADK internals that change between releases
+            "google-adk==1.2.1",                           # ADK framework
             "google-cloud-aiplatform[agent_engines]>=1.95.0",  # Vertex AI client
             "google-genai>=1.5.0,<2.0.0",                 # Google AI models
             "pydantic>=2.10.6,<3.0.0",                    # Data validation
@@ -177,6 +189,8 @@ def delete(resource_id: str) -> None:
     Warning:
         This operation is irreversible! The agent and all its data will be lost.
     """
+    from vertexai import agent_engines
+
     # Get reference to the remote agent using its resource ID
     remote_agent = agent_engines.get(resource_id)
     
@@ -201,9 +215,13 @@ def list_agents() -> None:
         - Finding resource IDs for management operations
         - Monitoring agent creation/update times
     """
-    # Get list of all agent engines in the current project
+    from vertexai import agent_engines
+
+    # Iterate over all agent engines in the current project
+    # list() fetches results page by page as we go, so nothing is collected
+    # into a list first
     remote_agents = agent_engines.list()
-    
+
     # Template for formatting each agent's information
     # This creates a consistent, readable output format
     template = """
@@ -211,14 +229,16 @@ def list_agents() -> None:
 - Create time: {agent.create_time}
 - Update time: {agent.update_time}
 """
-    
-    # Format each agent using the template
-    # This Python pattern creates a string for each agent, then joins them
-    remote_agents_string = "\n".join(
-        template.format(agent=agent) for agent in remote_agents
-    )
-    
-    print(f"All remote agents:\n{remote_agents_string}")
+
+    # Write each agent as soon as it arrives instead of joining them all into
+    # one string; the output is the same, blank lines between agents included
+    write = sys.stdout.write
+    write("All remote agents:\n")
+    separator = ""
+    for agent in remote_agents:
+        write(separator + template.format(agent=agent))
+        separator = "\n"
+    write("\n")
 
 
 def main(argv: list[str]) -> None:
@@ -40,6 +40,14 @@ import os
 # os: Built-in Python module for operating system interface
 # Used here for environment variable access
 
+import sys
+# sys: Built-in Python module for interpreter access
+# Used here to write streamed responses straight to stdout
+
+from concurrent.futures import ThreadPoolExecutor
+# ThreadPoolExecutor: Built-in worker threads
+# Used here to create the session while the user types the first message
+
 import vertexai
 # vertexai: Google Cloud's AI platform SDK
 # Required to connect to deployed Agent Engines
@@ -83,10 +91,113 @@ flags.DEFINE_string("user_id", None, "User ID (can be any string).")
 # This identifies the user session - can be any string like "test-user" or "nicky"
 # Example: --user_id=nicky
 
+flags.DEFINE_bool(
+    "quiet", False, "Only print the greeter's and the judge's replies."
+)
+# Skips the role assignments, research and individual debate turns
+# Example: --quiet
+
 # Mark these flags as required - the script won't run without them
 flags.mark_flag_as_required("resource_id")
 flags.mark_flag_as_required("user_id")
 
+# Agents whose replies --quiet keeps: the greeter, the judge's verdict, and
+# the workflow itself (it replays a cached debate for a repeat topic)
+QUIET_AUTHORS = frozenset(("DebateTeamGreeter", "DebateJudge", "AIDebateWorkflow"))
+
+
+def print_response(
+    agent, user_id: str, session_id: str, message: str, authors=None
+) -> None:
+    """
+    Sends one message to the agent and prints its reply as it streams in.
+
+    Args:
+        authors: If given, only events from these agents are printed
+    """
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+
+    # Send message to agent and stream the response
+    # stream_query() returns real-time events as the agent processes the request
+    for event in agent.stream_query(
+        user_id=user_id,             # Which user is sending this message
+        session_id=session_id,       # Which session this message belongs to
+        message=message             # The actual message content
+    ):
+        # stream_query() has no server-side event filter, so unwanted
+        # authors are skipped here before the event is parsed any further
+        if authors is not None and event.get("author") not in authors:
+            continue
+
+        # Parse the streaming event to extract the agent's response
+        # Agent responses are structured as content -> parts -> text; events
+        # without content (just metadata) fall through the empty defaults,
+        # and each key is looked up once
+        for part in (event.get("content") or {}).get("parts") or ():
+            # Skip parts without text (other types like function calls)
+            text = part.get("text")
+            if text:
+                # Print the agent's response in real-time
+                write(f"Response: {text}\n")
+        # One flush per event instead of one per printed line
+        flush()
+
+
+def chat(agent) -> None:
+    """
+    Runs the interactive chat loop against a deployed agent.
+
+    Session creation (often 1-3 seconds) runs on a worker thread, so it
+    overlaps with the user typing their first message instead of delaying
+    the prompt. input() and the response stream stay on the main thread, so
+    Ctrl-C interrupts them straight away.
+
+    Args:
+        agent: The remote agent returned by agent_engines.get()
+    """
+    # Read the flags once instead of on every message
+    user_id = FLAGS.user_id
+    authors = QUIET_AUTHORS if FLAGS.quiet else None
+
+    # Create a user session for this conversation
+    # Sessions help the agent maintain context across multiple messages
+    # Each user can have their own session to keep conversations separate
+    # The request starts now but its result is only read when it is needed
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending_session = executor.submit(agent.create_session, user_id=user_id)
+    # No more work for this thread; it exits once the session is created
+    executor.shutdown(wait=False)
+    session = None
+
+    # Start the interactive chat loop
+    print("Type 'quit' to exit.")
+
+    try:
+        # Main interaction loop - continues until user types 'quit'
+        while True:
+            # Get user input from command line (the session request keeps
+            # running on its thread while we wait)
+            user_input = input("Input: ")
+
+            # Check for exit condition
+            if user_input == "quit":
+                break
+
+            if session is None:
+                session = pending_session.result()
+                print(f"Created session for user ID: {user_id}")
+
+            # Print events as they arrive
+            print_response(agent, user_id, session["id"], user_input, authors)
+    finally:
+        # Clean up: Delete the session when the conversation is over
+        # This is good practice to avoid accumulating unused sessions
+        if session is None:
+            session = pending_session.result()
+        agent.delete_session(user_id=user_id, session_id=session["id"])
+        print(f"Deleted session for user ID: {user_id}")
+
 
 def main(argv: list[str]) -> None:  # pylint: disable=unused-argument
     """
@@ -99,7 +210,7 @@ def main(argv: list[str]) -> None:  # pylint: disable=unused-argument
     4. Initialize Vertex AI connection
     5. Connect to the deployed agent
     6. Create an interactive chat session
-    7. Stream responses in real-time
+    7. Stream responses in real-time (see chat())
     8. Clean up the session when done
     
     Args:
@@ -135,13 +246,6 @@ def main(argv: list[str]) -> None:  # pylint: disable=unused-argument
         else os.getenv("GOOGLE_CLOUD_STORAGE_BUCKET")
     )
 
-    # Note: There's some redundant code here (this overwrites the above variables)
-    # This is a common pattern in scripts that evolved over time
-    # The environment variables take precedence in this case
-    project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
-    location = os.getenv("GOOGLE_CLOUD_LOCATION")
-    bucket = os.getenv("GOOGLE_CLOUD_STORAGE_BUCKET")
-
     # Validate that all required configuration is present
     # Early validation prevents cryptic errors later in the process
     if not project_id:
@@ -168,53 +272,9 @@ def main(argv: list[str]) -> None:  # pylint: disable=unused-argument
     # This creates a client object for interacting with the remote agent
     agent = agent_engines.get(FLAGS.resource_id)
     print(f"Found agent with resource ID: {FLAGS.resource_id}")
-    
-    # Create a user session for this conversation
-    # Sessions help the agent maintain context across multiple messages
-    # Each user can have their own session to keep conversations separate
-    session = agent.create_session(user_id=FLAGS.user_id)
-    print(f"Created session for user ID: {FLAGS.user_id}")
-    
-    # Start the interactive chat loop
-    print("Type 'quit' to exit.")
-    
-    # Main interaction loop - continues until user types 'quit'
-    while True:
-        # Get user input from command line
-        user_input = input("Input: ")
-        
-        # Check for exit condition
-        if user_input == "quit":
-            break
-
-        # Send message to agent and stream the response
-        # stream_query() returns real-time events as the agent processes the request
-        for event in agent.stream_query(
-            user_id=FLAGS.user_id,       # Which user is sending this message
-            session_id=session["id"],    # Which session this message belongs to
-            message=user_input          # The actual message content
-        ):
-            # Parse the streaming event to extract the agent's response
-            # Events come in a nested structure that we need to unpack
-            
-            # Check if this event contains actual content (not just metadata)
-            if "content" in event:
-                # Check if the content has parts (agent responses are structured in parts)
-                if "parts" in event["content"]:
-                    parts = event["content"]["parts"]
-                    
-                    # Process each part of the response
-                    for part in parts:
-                        # Check if this part contains text (vs. other types like images)
-                        if "text" in part:
-                            text_part = part["text"]
-                            # Print the agent's response in real-time
-                            print(f"Response: {text_part}")
-
-    # Clean up: Delete the session when the conversation is over
-    # This is good practice to avoid accumulating unused sessions
-    agent.delete_session(user_id=FLAGS.user_id, session_id=session["id"])
-    print(f"Deleted session for user ID: {FLAGS.user_id}")
+
+    # Run the interactive chat loop
+    chat(agent)
 
 
 # --- SCRIPT ENTRY POINT ---
@@ -241,6 +301,9 @@ if __name__ == "__main__":
 #   Input: quit
 #   [Session ends and cleanup occurs]
 # 
+# Only show the greeter and the final verdict:
+#   python deployment/test_deployment.py --resource_id="..." --user_id="nicky" --quiet
+# 
 # Troubleshooting:
 #   - If "resource_id not found": Make sure you deployed an agent first with deploy.py --create
 #   - If "permission denied": Check your GCP authentication and project access
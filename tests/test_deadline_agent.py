@@ -0,0 +1,95 @@
+"""DeadlineAgent passes a fast sub-agent through and replaces a slow one."""
+
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+from google.adk.agents import BaseAgent  # noqa: E402
+from google.adk.events import Event  # noqa: E402
+from google.adk.runners import InMemoryRunner  # noqa: E402
+from google.genai import types  # noqa: E402
+
+from debate_team.custom_agents import DeadlineAgent  # noqa: E402
+
+_FALLBACK_STATE = {"findings": "No research findings (timeout)."}
+_TIMEOUT_MESSAGE = "Research timed out."
+
+
+class _StubAgent(BaseAgent):
+    """Yields one text event per entry of texts, sleeping delay before each."""
+
+    texts: List[str] = []
+    delay: float = 0.0
+    error: Optional[str] = None
+
+    async def _run_async_impl(self, ctx):
+        for text in self.texts:
+            await asyncio.sleep(self.delay)
+            yield Event(
+                author=self.name,
+                invocation_id=ctx.invocation_id,
+                branch=ctx.branch,
+                content=types.Content(role="model", parts=[types.Part(text=text)]),
+            )
+        if self.error:
+            raise RuntimeError(self.error)
+
+
+def _run(stub, timeout_seconds):
+    """Runs stub under a DeadlineAgent and returns (events, final state)."""
+    agent = DeadlineAgent(
+        name="Deadline",
+        sub_agents=[stub],
+        timeout_seconds=timeout_seconds,
+        fallback_state=_FALLBACK_STATE,
+        timeout_message=_TIMEOUT_MESSAGE,
+    )
+    runner = InMemoryRunner(agent=agent, app_name="test")
+
+    async def run():
+        session = await runner.session_service.create_session(app_name="test", user_id="user")
+        message = types.Content(role="user", parts=[types.Part(text="go")])
+        events = [
+            event
+            async for event in runner.run_async(
+                user_id="user", session_id=session.id, new_message=message
+            )
+        ]
+        session = await runner.session_service.get_session(
+            app_name="test", user_id="user", session_id=session.id
+        )
+        return events, session.state
+
+    return asyncio.run(run())
+
+
+def test_slow_sub_agent_is_replaced_by_one_fallback_event():
+    stub = _StubAgent(name="Slow", texts=["too late"], delay=5.0)
+
+    events, state = _run(stub, timeout_seconds=0.1)
+
+    assert len(events) == 1
+    assert events[0].author == "Deadline"
+    assert events[0].content.parts[0].text == _TIMEOUT_MESSAGE
+    assert events[0].actions.state_delta == _FALLBACK_STATE
+    assert state["findings"] == _FALLBACK_STATE["findings"]
+
+
+def test_fast_sub_agent_events_pass_through():
+    stub = _StubAgent(name="Fast", texts=["first", "second"])
+
+    events, state = _run(stub, timeout_seconds=5.0)
+
+    assert [event.author for event in events] == ["Fast", "Fast"]
+    assert [event.content.parts[0].text for event in events] == ["first", "second"]
+    assert "findings" not in state
+
+
+def test_sub_agent_error_propagates():
+    stub = _StubAgent(name="Broken", texts=["partial"], error="search failed")
+
+    with pytest.raises(RuntimeError, match="search failed"):
+        _run(stub, timeout_seconds=5.0)
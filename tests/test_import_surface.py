@@ -0,0 +1,61 @@
+"""Import-cost checks for the debate_team package.
+
+Each case runs in a fresh interpreter, because sys.modules in the test
+process already holds whatever earlier tests imported.
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Prints which of the interesting modules an "import debate_team" loaded
+_PROBE = (
+    "import json, sys; import debate_team; "
+    "print(json.dumps({name: name in sys.modules "
+    "for name in ('debate_team.agent', 'google.adk')}))"
+)
+
+
+def _adk_installed():
+    try:
+        return importlib.util.find_spec("google.adk") is not None
+    except ModuleNotFoundError:
+        # find_spec imports the parent package, and "google" may be missing too
+        return False
+
+
+def _loaded_after_import(eager):
+    env = dict(os.environ)
+    env.pop("DEBATE_TEAM_EAGER_IMPORT", None)
+    if eager:
+        env["DEBATE_TEAM_EAGER_IMPORT"] = "1"
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (str(REPO_ROOT), env.get("PYTHONPATH"))))
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_default_import_is_lazy():
+    loaded = _loaded_after_import(eager=False)
+    assert not loaded["debate_team.agent"]
+    assert not loaded["google.adk"]
+
+
+@pytest.mark.skipif(not _adk_installed(), reason="google-adk is not installed")
+def test_eager_import_loads_agent_and_adk():
+    loaded = _loaded_after_import(eager=True)
+    assert loaded["debate_team.agent"]
+    assert loaded["google.adk"]
@@ -0,0 +1,24 @@
+"""root_agent is built on first access and then reused."""
+
+import debate_team.agent as agent_module
+
+
+def test_root_agent_is_built_once_on_first_access(monkeypatch):
+    sentinel = object()
+    calls = []
+
+    def fake_build_root_agent():
+        calls.append(1)
+        return sentinel
+
+    # Start from the not-yet-built state and count factory calls
+    monkeypatch.delitem(vars(agent_module), "root_agent", raising=False)
+    monkeypatch.setattr(agent_module, "build_root_agent", fake_build_root_agent)
+    assert calls == []
+
+    first = agent_module.root_agent
+    second = agent_module.root_agent
+
+    assert first is sentinel
+    assert second is first
+    assert len(calls) == 1
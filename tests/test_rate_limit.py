@@ -0,0 +1,119 @@
+"""Token-bucket pacing and 429/503 retries of RateLimitedGemini."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+from google.adk.models import Gemini, LlmRequest, LlmResponse  # noqa: E402
+from google.genai import errors  # noqa: E402
+
+from debate_team import rate_limit  # noqa: E402
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces the bucket's clock with one the test advances by hand."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def test_bucket_allows_a_full_minute_then_queues_callers(clock):
+    bucket = rate_limit._TokenBucket(60)
+
+    assert [bucket._reserve(1) for _ in range(60)] == [0.0] * 60
+    # Refills at one token per second, and each caller waits behind the last
+    assert bucket._reserve(1) == pytest.approx(1.0)
+    assert bucket._reserve(1) == pytest.approx(2.0)
+
+    clock.value += 2.0
+    assert bucket._reserve(1) == pytest.approx(1.0)
+
+
+def test_bucket_refill_is_capped_at_capacity(clock):
+    bucket = rate_limit._TokenBucket(60)
+    bucket._reserve(60)
+
+    clock.value += 3600.0
+    assert bucket._reserve(60) == 0.0
+    assert bucket._reserve(1) == pytest.approx(1.0)
+
+
+def _quota_error():
+    return errors.APIError(429, {"error": {"message": "quota", "status": "RESOURCE_EXHAUSTED"}})
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Stubs the Gemini call that RateLimitedGemini wraps.
+
+    Set upstream.outcomes to one list per attempt; each entry is a response
+    to yield or an exception to raise. upstream.attempts counts the calls.
+    """
+    stub = SimpleNamespace(outcomes=[], attempts=0)
+
+    async def fake_generate_content_async(self, llm_request, stream=False):
+        steps = stub.outcomes[stub.attempts]
+        stub.attempts += 1
+        for step in steps:
+            if isinstance(step, Exception):
+                raise step
+            yield step
+
+    monkeypatch.setattr(Gemini, "generate_content_async", fake_generate_content_async)
+    monkeypatch.setattr(rate_limit, "_REQUEST_BUCKET", None)
+    monkeypatch.setattr(rate_limit, "_TOKEN_BUCKET", None)
+    monkeypatch.setattr(rate_limit, "_BASE_DELAY_SECONDS", 0.0)
+    return stub
+
+
+def _generate():
+    """Returns every response RateLimitedGemini streams for one request."""
+    model = rate_limit.RateLimitedGemini(model="gemini-2.0-flash")
+
+    async def collect():
+        return [
+            response
+            async for response in model.generate_content_async(LlmRequest(), stream=True)
+        ]
+
+    return asyncio.run(collect())
+
+
+def test_quota_error_before_the_first_chunk_is_retried(upstream):
+    response = LlmResponse(partial=False)
+    upstream.outcomes = [[_quota_error()], [response]]
+
+    assert _generate() == [response]
+    assert upstream.attempts == 2
+
+
+def test_error_after_a_streamed_chunk_is_not_retried(upstream):
+    upstream.outcomes = [[LlmResponse(partial=True), _quota_error()], [LlmResponse()]]
+
+    with pytest.raises(errors.APIError):
+        _generate()
+
+    assert upstream.attempts == 1
+
+
+def test_retries_stop_after_max_attempts(upstream):
+    upstream.outcomes = [[_quota_error()]] * (rate_limit._MAX_ATTEMPTS + 1)
+
+    with pytest.raises(errors.APIError):
+        _generate()
+
+    assert upstream.attempts == rate_limit._MAX_ATTEMPTS
+
+
+def test_other_errors_are_not_retried(upstream):
+    bad_request = errors.APIError(400, {"error": {"message": "bad", "status": "INVALID_ARGUMENT"}})
+    upstream.outcomes = [[bad_request], [LlmResponse()]]
+
+    with pytest.raises(errors.APIError):
+        _generate()
+
+    assert upstream.attempts == 1
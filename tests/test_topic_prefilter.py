@@ -0,0 +1,38 @@
+"""The greeter's topic prefilter only fires on explicit debate requests."""
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+from debate_team.callbacks import extract_debate_topic  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    ("text", "topic"),
+    [
+        ("debate nuclear power", "nuclear power"),
+        ("Let's debate universal basic income!", "universal basic income"),
+        ("can we debate about remote work?", "remote work"),
+        ("please debate on US tariffs.", "US tariffs"),
+        ("I'd like to debate whether cats are better than dogs", "whether cats are better than dogs"),
+    ],
+)
+def test_explicit_requests_yield_the_topic(text, topic):
+    assert extract_debate_topic(text) == topic
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "hello",
+        "Should we stop?",
+        "let's debate again",
+        "can we debate another one?",
+        "debate me",
+        "can we debate with you?",
+        "Debate is fun, right?",
+        "debate team, what can you do?",
+    ],
+)
+def test_other_messages_go_to_the_model(text):
+    assert extract_debate_topic(text) is None